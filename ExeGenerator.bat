@@ -1 +1,2 @@
+python main.py --bake-assets
 pyinstaller PlaneWar.spec
\ No newline at end of file
@@ -1,13 +1,25 @@
+from time import perf_counter
+
+# 进程启动时间，用于统计启动各阶段耗时和首帧耗时（放在其余导入之前，以便计入模块导入耗时）
+STARTUP_TIME = perf_counter()
+
+import csv
+import hashlib
+import heapq
 import json
 import math
+import mmap
 import os
 import random
+import struct
 import sys
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from threading import current_thread, main_thread
 from time import time
-from traceback import print_exc
 from typing import *
-from uuid import uuid4
 
 # 禁用libpng警告和pygame支持提示
 os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
@@ -22,128 +34,446 @@ except Exception:
     print("需要 pygame 库来运行此脚本。请先安装：pip install pygame")
     raise
 
+class WallClock:
+    """墙上时钟，返回真实经过的毫秒数，供界面动画等不随游戏暂停的定时器使用"""
+    def now(self) -> float:
+        return time() * 1000
+
+class LoopClock:
+    """以 asyncio 事件循环时间为准的时钟，异步模式下界面定时器与帧节奏共用同一时间源"""
+    def __init__(self, loop: Any):
+        self.loop = loop  # asyncio 事件循环
+
+    def now(self) -> float:
+        return self.loop.time() * 1000
+
+class SimulationClock:
+    """游戏时间时钟，只随游戏逻辑更新推进
+
+    暂停、弹窗或停留在标题界面时不推进；无界面运行或回放时可直接调用 advance 快进。
+    """
+    def __init__(self):
+        self.now_ms: float = 0.0  # 当前游戏时间（毫秒）
+
+    def now(self) -> float:
+        return self.now_ms
+
+    def advance(self, ms: float) -> None:
+        """推进游戏时间"""
+        self.now_ms += ms
+
 class Task:
     """定时器任务类"""
-    def __init__(self, func: Callable[[], None], period_ms: float):
+    def __init__(self, func: Callable[[], None], period_ms: float, delay_ms: float = 0, label: Optional[str] = None):
         self.func: Callable[[], None] = func  # 要执行的函数
+        self.label: str = label or Task.label_of(func)  # 统计用的任务名称
         self.period_ms: float = period_ms  # 执行周期（毫秒）
+        self.delay_ms: float = delay_ms  # 首次执行前额外等待的时间（毫秒），执行一次后清零
         self.last_run_time: float = time() * 1000  # 上次执行时间（毫秒）
-        self.is_cancelled: bool = False  # 任务是否被取消
+        self.due_time: float = self.last_run_time + delay_ms + period_ms  # 下次到期时间（毫秒），作为堆的排序键
+        self.cancelled: bool = False  # 任务本身是否被取消
+        self.scheduler: Optional['TaskScheduler'] = None  # 所属调度器，加入调度器后改用其时钟计时
+        self.scope: Optional['TaskScope'] = None  # 所属作用域，作用域关闭后任务视为已取消
+    
+    @staticmethod
+    def label_of(func: Any) -> str:
+        """由函数或生成器的限定名生成任务名称，去掉其中的 <locals>"""
+        name = getattr(func, '__qualname__', None) or type(func).__name__
+        return name.replace('.<locals>', '')
+    
+    @property
+    def is_cancelled(self) -> bool:
+        """任务是否被取消（包括所属作用域已关闭）"""
+        return self.cancelled or (self.scope is not None and self.scope.closed)
         
     def cancel(self) -> None:
-        """取消任务"""
-        self.is_cancelled = True
+        """取消任务，任务留在堆中，直到弹出时才真正丢弃"""
+        if self.is_cancelled:
+            return
+        self.cancelled = True
+        if self.scope is not None:
+            self.scope.live -= 1
+        if self.scheduler is not None:
+            self.scheduler.note_cancelled()
         
     def should_run(self) -> bool:
         """检查任务是否应该执行"""
         if self.is_cancelled:
             return False
-        current_time = time() * 1000
-        return current_time - self.last_run_time >= self.period_ms
+        current_time = self.scheduler.clock.now() if self.scheduler is not None else time() * 1000
+        return current_time - self.last_run_time >= self.delay_ms + self.period_ms
     
-    def run(self) -> None:
-        """执行任务并更新最后执行时间"""
+    def run(self, now_ms: Optional[float] = None) -> bool:
+        """执行任务并更新最后执行时间，任务函数抛出异常时返回 False"""
+        ok = True
         if not self.is_cancelled:
             try:
                 self.func()
             except Exception as e:
-                Utils.debug(f"Task error: {e}")
-            self.last_run_time = time() * 1000
+                Utils.debug(f"Task error ({self.label}): {e}")
+                ok = False
+            self.last_run_time = time() * 1000 if now_ms is None else now_ms
+            self.delay_ms = 0
+            self.due_time = self.last_run_time + self.period_ms
+        return ok
+
+class OneShotTask(Task):
+    """只执行一次的任务，执行后自行取消，调度器弹出后不再入堆"""
+    def run(self, now_ms: Optional[float] = None) -> bool:
+        """执行任务后立即标记为取消"""
+        ok = super().run(now_ms)
+        self.cancel()
+        return ok
+
+class Wait:
+    """协程让出的等待指令，由 wait() / next_tick() 创建"""
+    __slots__ = ('ms',)
+
+    def __init__(self, ms: float):
+        self.ms = ms  # 等待的时间（毫秒）
+
+def wait(ms: float) -> Wait:
+    """在协程中 `yield wait(ms)`，暂停 ms 毫秒后继续执行（按所在调度器的时钟计时）"""
+    return Wait(ms)
+
+def next_tick() -> Wait:
+    """在协程中 `yield next_tick()`，在调度器的下一次更新时继续执行"""
+    return Wait(0)
+
+class Coroutine(Task):
+    """以生成器编写的多步骤任务
+
+    生成器每次让出一个 Wait 指令，任务按指令的时长重新入堆；生成器结束后任务自行取消。
+    整个脚本只占用堆中的一个任务，取代原先多个相互配合的定时任务和闭包状态。
+    """
+    def __init__(self, generator: Generator[Wait, None, None]):
+        super().__init__(self._step, 0, label=Task.label_of(generator))
+        self.generator = generator  # 要执行的生成器
+
+    def _step(self) -> None:
+        """执行到生成器的下一个 yield，并把等待时长作为下一次的周期"""
+        try:
+            command = next(self.generator)
+        except StopIteration:
+            self.cancel()
+            return
+        if self.is_cancelled:
+            # 协程在执行中取消了自己，此时才能关闭生成器
+            self.generator.close()
+            return
+        self.period_ms = command.ms
+
+    def cancel(self) -> None:
+        """取消任务并关闭生成器，生成器中的 finally 块会被执行
+
+        协程在执行中取消自己时生成器无法关闭，留到本次执行让出后再关闭。
+        """
+        super().cancel()
+        if not self.generator.gi_running:
+            self.generator.close()
+
+class TaskStats:
+    """同一名称任务的执行统计"""
+    __slots__ = ('runs', 'errors', 'lag_total', 'lag_max', 'cost_total', 'cost_max')
 
-class TaskScheduler:
-    """任务调度器类，用于管理所有定时器任务"""
     def __init__(self):
-        self.tasks: List[Task] = []  # 存储所有活跃任务
-        
+        self.runs = 0  # 执行次数
+        self.errors = 0  # 任务函数抛出异常的次数
+        self.lag_total = 0.0  # 实际执行时间晚于到期时间的累计值（毫秒）
+        self.lag_max = 0.0  # 最大延迟（毫秒）
+        self.cost_total = 0.0  # 任务函数累计耗时（毫秒）
+        self.cost_max = 0.0  # 单次最大耗时（毫秒）
+
+    def record(self, lag: float, cost: float, ok: bool) -> None:
+        """记录一次执行"""
+        self.runs += 1
+        self.lag_total += lag
+        self.cost_total += cost
+        if lag > self.lag_max:
+            self.lag_max = lag
+        if cost > self.cost_max:
+            self.cost_max = cost
+        if not ok:
+            self.errors += 1
+
+class TaskScope:
+    """调度器中的任务作用域
+
+    通过作用域添加的任务在作用域关闭时一并失效。关闭只设置一个标志，已在堆中的任务在弹出时丢弃，
+    因此丢弃整个作用域的耗时与其中的任务数无关。可作为 runTaskLater / runTaskTimer 的 scheduler 参数。
+    """
+    def __init__(self, scheduler: 'TaskScheduler', name: str):
+        self.scheduler = scheduler  # 所属调度器
+        self.name = name  # 作用域名称
+        self.closed = False  # 是否已关闭
+        self.live = 0  # 作用域中未取消的任务数
+
+    @property
+    def clock(self) -> Union[WallClock, LoopClock, SimulationClock]:
+        """所属调度器的时钟"""
+        return self.scheduler.clock
+
+    def add_task(self, task: Task) -> Task:
+        """通过该作用域添加任务"""
+        if self.closed:
+            task.cancelled = True
+            return task
+        task.scope = self
+        if not task.cancelled:
+            self.live += 1
+        return self.scheduler.add_task(task)
+
+    def close(self) -> None:
+        """关闭作用域，其中的任务全部视为已取消"""
+        if self.closed:
+            return
+        self.closed = True
+        self.scheduler.cancelled += self.live
+        self.live = 0
+
+class TaskScheduler:
+    """任务调度器类，用于管理所有定时器任务
+
+    任务按下次到期时间存放在最小堆中，每帧只读取一次时钟并弹出已到期的任务。
+    取消任务采用惰性删除：任务只做标记，弹出时丢弃；已取消的任务占到堆的一半以上时整体重建一次。
+    """
+    COMPACT_MIN_SIZE = 64  # 堆小于该大小时不做重建
+    PENDING_SAMPLE_MS = 1000  # 记录待执行任务数的间隔（毫秒，按调度器时钟）
+    PENDING_HISTORY = 3600  # 最多保留的待执行任务数记录条数
+
+    def __init__(self, clock: Optional[Union[WallClock, LoopClock, SimulationClock]] = None):
+        self.clock = clock or WallClock()  # 计时所用的时钟
+        self.heap: List[Tuple[float, int, Task]] = []  # (到期时间, 序号, 任务)，序号保证同一时刻按加入顺序执行
+        self.sequence = 0  # 递增序号
+        self.cancelled = 0  # 堆中已取消但尚未弹出的任务数
+        self.running: Optional[Task] = None  # 正在执行的任务，执行期间它不在堆中
+        self.scopes: Dict[str, TaskScope] = {}  # 按名称记录当前的作用域
+        self.stats: Dict[str, TaskStats] = {}  # 按任务名称统计的延迟、耗时、次数和错误
+        self.pending_history: Deque[Tuple[float, int]] = deque(maxlen=self.PENDING_HISTORY)  # (时钟时间, 待执行任务数)
+        self._next_pending_sample = 0.0
+        
+    @property
+    def tasks(self) -> List[Task]:
+        """当前所有未取消的任务（按到期时间无序），包括正在执行的任务"""
+        tasks = [task for _, _, task in self.heap if not task.is_cancelled]
+        if self.running is not None and not self.running.is_cancelled:
+            tasks.append(self.running)
+        return tasks
+    
+    def __len__(self) -> int:
+        return len(self.heap) - self.cancelled
+    
     def add_task(self, task: Task) -> Task:
         """添加一个任务到调度器"""
-        self.tasks.append(task)
+        task.scheduler = self
+        task.last_run_time = self.clock.now()
+        task.due_time = task.last_run_time + task.delay_ms + task.period_ms
+        if not task.is_cancelled:
+            self._push(task)
         return task
     
+    def _push(self, task: Task) -> None:
+        heapq.heappush(self.heap, (task.due_time, self.sequence, task))
+        self.sequence += 1
+    
+    def set_clock(self, clock: Union[WallClock, LoopClock, SimulationClock]) -> None:
+        """更换时钟，已有任务的时间按新旧时钟的差值平移，剩余等待时间不变"""
+        shift = clock.now() - self.clock.now()
+        self.clock = clock
+        self._next_pending_sample += shift
+        entries = []
+        for _, seq, task in self.heap:
+            task.last_run_time += shift
+            task.due_time += shift
+            entries.append((task.due_time, seq, task))
+        self.heap = entries
+        heapq.heapify(self.heap)
+    
+    def new_scope(self, name: str) -> TaskScope:
+        """创建指定名称的作用域，同名的旧作用域会被关闭"""
+        old = self.scopes.get(name)
+        if old is not None:
+            old.close()
+        scope = self.scopes[name] = TaskScope(self, name)
+        return scope
+    
+    def profile_lines(self, label: str) -> List[str]:
+        """调试信息：各作用域中的任务数和闭包引用的变量数"""
+        stats: Dict[str, List[int]] = {}
+        for _, _, task in self.heap:
+            if task.is_cancelled:
+                continue
+            entry = stats.setdefault(task.scope.name if task.scope is not None else '-', [0, 0])
+            entry[0] += 1
+            entry[1] += len(getattr(task.func, '__closure__', None) or ())
+        parts = [f"{name} {count}/{cells}" for name, (count, cells) in sorted(stats.items())]
+        return [f"{label} 任务/闭包变量 (堆 {len(self.heap)}): " + ('  '.join(parts) or '无')]
+    
+    def stats_lines(self, label: str, top: int = 3) -> List[str]:
+        """性能面板显示的调度统计：总体情况和累计耗时最多的几个任务"""
+        runs = sum(stats.runs for stats in self.stats.values())
+        errors = sum(stats.errors for stats in self.stats.values())
+        lines = [f"{label}定时器: 待执行 {len(self)}, 已执行 {runs}, 出错 {errors}"]
+        ranked = sorted(self.stats.items(), key=lambda item: item[1].cost_total, reverse=True)[:top]
+        for name, stats in ranked:
+            if len(name) > 28:
+                name = '…' + name[-27:]
+            lines.append(f"  {name} x{stats.runs} 延迟≤{stats.lag_max:.0f} ms 耗时 {stats.cost_total / stats.runs * 1000:.0f} us"
+                         + (f" 出错 {stats.errors}" if stats.errors else ''))
+        return lines
+    
+    def dump_csv(self, writer: Any, label: str) -> None:
+        """把按任务名称的统计写入 csv.writer"""
+        for name, stats in sorted(self.stats.items()):
+            writer.writerow([label, name, stats.runs, stats.errors,
+                             f"{stats.lag_total / stats.runs:.3f}", f"{stats.lag_max:.3f}",
+                             f"{stats.cost_total / stats.runs:.4f}", f"{stats.cost_max:.4f}"])
+    
+    @staticmethod
+    def export_csv(path: str, schedulers: Dict[str, 'TaskScheduler']) -> None:
+        """导出调度统计：path 为按任务统计，同名加 _pending 后缀的文件为待执行任务数随时间的变化"""
+        try:
+            with open(path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(['scheduler', 'task', 'runs', 'errors', 'lag_avg_ms', 'lag_max_ms', 'cost_avg_ms', 'cost_max_ms'])
+                for label, scheduler in schedulers.items():
+                    scheduler.dump_csv(writer, label)
+            root, ext = os.path.splitext(path)
+            with open(f"{root}_pending{ext or '.csv'}", 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(['scheduler', 'clock_ms', 'pending'])
+                for label, scheduler in schedulers.items():
+                    for clock_ms, pending in scheduler.pending_history:
+                        writer.writerow([label, f"{clock_ms:.0f}", pending])
+            Utils.debug(f"调度统计已导出到 {path}")
+        except OSError as e:
+            Utils.error(f"导出调度统计失败: {e}")
+    
+    def note_cancelled(self) -> None:
+        """记录一个任务被取消"""
+        self.cancelled += 1
+    
+    def _compact(self) -> None:
+        """重建堆，释放已取消任务占用的空间"""
+        self.heap = [entry for entry in self.heap if not entry[2].is_cancelled]
+        heapq.heapify(self.heap)
+        self.cancelled = 0
+    
     def update(self) -> None:
-        """更新并执行到期的任务，清理已取消的任务"""
-        # 创建一个新列表存储活跃任务
-        active_tasks: List[Task] = []
-        
-        for task in self.tasks:
-            # 检查任务是否已取消
+        """执行到期的任务，丢弃弹出的已取消任务
+
+        每个任务每帧最多执行一次，周期任务执行后重新入堆。
+        """
+        if self.cancelled * 2 > len(self.heap) >= self.COMPACT_MIN_SIZE:
+            self._compact()
+        heap = self.heap
+        now = self.clock.now()
+        if now >= self._next_pending_sample:
+            self.pending_history.append((now, len(self)))
+            self._next_pending_sample = now + self.PENDING_SAMPLE_MS
+        rescheduled: List[Task] = []
+        while heap and heap[0][0] <= now:
+            due, _, task = heapq.heappop(heap)
             if task.is_cancelled:
+                self.cancelled -= 1
                 continue
-            
-            # 检查任务是否应该执行
-            if task.should_run():
-                task.run()
-            
-            # 如果任务未被取消，保留到活跃列表中
-            if not task.is_cancelled:
-                active_tasks.append(task)
-        
-        # 更新任务列表，只保留活跃任务
-        self.tasks = active_tasks
+            self.running = task
+            start = perf_counter()
+            ok = task.run(now)
+            cost = (perf_counter() - start) * 1000
+            self.running = None
+            stats = self.stats.get(task.label)
+            if stats is None:
+                stats = self.stats[task.label] = TaskStats()
+            stats.record(now - due, cost, ok)
+            if task.is_cancelled:
+                # 任务在执行时取消了自己，此时它已不在堆中
+                self.cancelled -= 1
+            else:
+                rescheduled.append(task)
+        for task in rescheduled:
+            self._push(task)
     
     def clear(self) -> None:
         """清除所有任务"""
-        self.tasks.clear()
+        self.heap.clear()
+        self.cancelled = 0
+        for scope in self.scopes.values():
+            scope.live = 0
+
+# 创建全局游戏时钟实例
+global_sim_clock = SimulationClock()
 
-# 创建全局任务调度器实例
-global_task_scheduler = TaskScheduler()
+# 创建全局任务调度器实例，游戏逻辑定时器按游戏时间计时
+global_task_scheduler = TaskScheduler(global_sim_clock)
 
-def runTaskLater(func: Callable[[], None], delayMs: float) -> Task:
+# 创建全局界面调度器实例，界面动画定时器按真实时间计时，暂停时照常运行
+global_ui_scheduler = TaskScheduler(WallClock())
+
+def runTaskLater(func: Callable[[], None], delayMs: float,
+                scheduler: Optional[Union[TaskScheduler, TaskScope]] = None) -> Task:
     """全局函数，创建并启动一个延迟执行一次的任务
     
     Args:
         func: 要执行的函数或lambda表达式
         delayMs: 延迟时间（毫秒）
+        scheduler: 所用调度器或作用域，默认为按游戏时间计时的 global_task_scheduler
     
     Returns:
         Task: 创建的任务对象，可以通过task.cancel()取消任务
     """
     if func is None:
         raise ValueError("任务函数不能为空")
+    if scheduler is None:
+        scheduler = global_task_scheduler
     
-    # 创建一个简单的包装函数
-    def one_time_func() -> None:
-        func()
-        # 获取当前任务并取消
-        for t in global_task_scheduler.tasks:
-            if t.func == one_time_func:
-                t.cancel()
-                break
-    
-    # 创建任务对象
-    task: Task = Task(one_time_func, delayMs)
+    # 创建一次性任务对象，执行后由调度器直接丢弃
+    task: Task = OneShotTask(func, delayMs)
     # 添加到调度器
-    return global_task_scheduler.add_task(task)
+    return scheduler.add_task(task)
 
-def runTaskTimer(func: Callable[[], None], delayMs: float = 0, periodMs: float = 10) -> Task:
+def runTaskTimer(func: Callable[[], None], delayMs: float = 0, periodMs: float = 10,
+                 scheduler: Optional[Union[TaskScheduler, TaskScope]] = None) -> Task:
     """全局函数，创建并启动一个定时任务
     
     Args:
         func: 要执行的函数或lambda表达式
         delayMs: 初始延迟时间（毫秒），默认0毫秒
         periodMs: 任务执行周期（毫秒），默认10毫秒
+        scheduler: 所用调度器或作用域，默认为按游戏时间计时的 global_task_scheduler
     
     Returns:
-        Task: 创建的任务对象，可以通过task.cancel()取消任务
+        Task: 创建的任务对象，延迟阶段和周期阶段都由它负责，可以通过task.cancel()随时取消
     """
     if func is None:
         raise ValueError("任务函数不能为空")
+    if scheduler is None:
+        scheduler = global_task_scheduler
     
-    # 简单实现：如果有延迟，先创建一个延迟任务
-    if delayMs > 0:
-        # 创建一个包装函数用于启动周期性任务
-        def start_periodic() -> None:
-            # 创建并添加周期性任务
-            periodic_task: Task = Task(func, periodMs)
-            global_task_scheduler.add_task(periodic_task)
-        
-        # 创建延迟任务
-        delay_task: Task = Task(start_periodic, delayMs)
-        return global_task_scheduler.add_task(delay_task)
-    else:
-        # 没有延迟，直接创建周期任务
-        task: Task = Task(func, periodMs)
-        return global_task_scheduler.add_task(task)
+    # 同一个任务对象负责两个阶段：首次执行在延迟加一个周期之后（与先等待延迟再开始周期计时一致），之后按周期执行
+    return scheduler.add_task(Task(func, periodMs, delayMs))
+
+def runCoroutine(generator: Generator[Wait, None, None],
+                 scheduler: Optional[Union[TaskScheduler, TaskScope]] = None) -> Task:
+    """全局函数，启动一个生成器协程
+
+    协程立即执行到第一个 yield，之后由调度器按让出的 wait(ms) / next_tick() 继续执行。
+    
+    Args:
+        generator: 让出 Wait 指令的生成器
+        scheduler: 所用调度器或作用域，默认为按游戏时间计时的 global_task_scheduler
+    
+    Returns:
+        Task: 协程任务对象，可以通过task.cancel()取消并关闭生成器
+    """
+    if generator is None:
+        raise ValueError("协程不能为空")
+    if scheduler is None:
+        scheduler = global_task_scheduler
+    
+    task = Coroutine(generator)
+    task.run(scheduler.clock.now())
+    return scheduler.add_task(task)
 
 _VERSION = "1.0.0"
 
@@ -165,6 +495,8 @@ ASSETS_IMG = os.path.join(ASSETS, 'images')
 ASSETS_SFX = os.path.join(ASSETS, 'sfx')
 ASSETS_FONTS = os.path.join(ASSETS, 'fonts')
 ASSETS_MUSIC = os.path.join(ASSETS, 'music')
+# 预烘焙资源包，由 `python main.py --bake-assets` 生成
+ASSET_PACK_PATH = os.path.join(ASSETS, 'assets.pack')
 
 # 游戏状态常量
 GAME_STATE_TITLE = 'title'
@@ -206,6 +538,26 @@ SOUND_CLICK = 'click'
 SOUND_FAIL = 'fail'
 SOUND_POWERUP = 'powerup'
 
+# 音效播放配置：名称 -> (优先级, 最大同时发声数, 增益)
+# 优先级越高越不容易被抢占；增益与音量设置相乘，只在音量变化时应用
+SOUND_PROFILES = {
+    'player_shoot': (1, 3, 0.6),
+    'enemy_shoot': (1, 3, 0.5),
+    SOUND_EXPLODE: (2, 4, 0.9),
+    'shield_hit': (2, 2, 0.8),
+    SOUND_HOVER: (3, 1, 0.7),
+    'popup': (3, 1, 1.0),
+    SOUND_POWERUP: (3, 1, 1.0),
+    'shield_fail': (3, 1, 1.0),
+    SOUND_CLICK: (4, 2, 0.8),
+    SOUND_FAIL: (4, 1, 1.0),
+}
+DEFAULT_SOUND_PROFILE = (1, 4, 1.0)
+# 混音器配置，可通过 --audio-buffer / --audio-channels 覆盖
+AUDIO_FREQUENCY = 44100
+AUDIO_BUFFER = 512  # 每次回调的采样帧数，越小延迟越低，过小可能爆音
+AUDIO_CHANNELS = 16  # 音效混音通道数
+
 # 随机事件类型常量
 EVENT_TECH_DEVELOP = 'tech_develop'  # 科技发展
 EVENT_ECONOMY_DEVELOP = 'economy_develop'  # 经济发展
@@ -222,6 +574,48 @@ PLAYER_SIZE = (54, 54)  # 宽高（在窗口中的像素）
 ENEMY_SIZE = (48, 48)
 BULLET_SIZE = (8, 16)
 BG_SIZE = (SCREEN_W, SCREEN_H)
+BG_SCROLL_SPEED = 300.0  # 背景每秒向下滚动的像素数
+POWERUP_SIZE = (64, 64)
+LOGO_SIZE = (120, 120)
+
+# 画质调节步骤，帧耗时超出预算时按顺序逐级关闭
+QUALITY_NO_PULSE = 'no_pulse'  # 关闭道具和随机事件的脉冲特效
+QUALITY_FLAT_OVERLAY = 'flat_overlay'  # 设置界面和弹窗的模糊背景改为纯色暗化
+QUALITY_LIMIT_FLOATING_TEXT = 'limit_floating_text'  # 限制每秒新增的浮动文字数量
+QUALITY_MERGE_EXPLOSIONS = 'merge_explosions'  # 合并重叠的爆炸
+QUALITY_LIMIT_VOICES = 'limit_voices'  # 每个音效只保留一个发声
+FLOATING_TEXT_PER_SECOND = 4  # 限制浮动文字时每秒最多新增的数量
+
+# 表面格式分类阈值：透明像素足够多且半透明像素足够少时使用 RLE 编码的 alpha 表面
+RLE_MIN_TRANSPARENT = 0.1
+RLE_MAX_PARTIAL = 0.25
+
+# 需要预烘焙到资源包中的图片及其运行时尺寸
+BAKED_IMAGES = [
+    ('background', BG_SIZE),
+    ('player', PLAYER_SIZE),
+    ('enemy1', ENEMY_SIZE),
+    ('enemy2', ENEMY_SIZE),
+    ('enemy3', ENEMY_SIZE),
+    ('enemy4', ENEMY_SIZE),
+    ('bullet', BULLET_SIZE),
+    ('speed', POWERUP_SIZE),
+    ('shield', POWERUP_SIZE),
+    ('heal', POWERUP_SIZE),
+    ('super_rapid_shoot', POWERUP_SIZE),
+    ('super_scatter_shoot', POWERUP_SIZE),
+    ('random_event', POWERUP_SIZE),
+    ('logo', LOGO_SIZE),
+]
+# 打包进纹理图集的精灵（背景尺寸与屏幕相同，单独保存）
+ATLAS_SPRITES = [entry for entry in BAKED_IMAGES if entry[0] != 'background']
+ATLAS_MAX_WIDTH = 512
+
+# 标题界面需要的关键资源，在首帧之前同步加载
+CRITICAL_IMAGES = [('background', BG_SIZE), ('logo', LOGO_SIZE)]
+CRITICAL_SOUNDS = [SOUND_HOVER, SOUND_CLICK]
+# 其余资源在后台线程中加载
+DEFERRED_IMAGES = [entry for entry in BAKED_IMAGES if entry not in CRITICAL_IMAGES]
 
 # 字体候选列表（优先使用 Windows 预装中文字体）
 FONT_CANDIDATES = ['SimHei', 'Microsoft YaHei', 'SimSun', 'KaiTi', 'Microsoft JhengHei']
@@ -278,6 +672,53 @@ show_detail = False
 # 全局对象ID计数器，用于为所有实体对象分配唯一ID
 object_id = 0
 
+# 启动耗时分析器
+class StartupProfiler:
+    """记录启动各阶段的开始时间和耗时，通过 `--startup-profile` 启用，首帧后以表格输出"""
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.records: List[Tuple[str, float, float, str]] = []  # (阶段, 开始时间, 耗时, 线程)
+        self.reported = False
+
+    def mark(self, label: str, start: float = STARTUP_TIME) -> None:
+        """记录从 start 到现在的一个阶段，默认从进程启动算起"""
+        if self.enabled:
+            self.records.append((label, start, perf_counter() - start, current_thread().name))
+
+    @contextmanager
+    def section(self, label: str):
+        """记录 with 块的耗时"""
+        if not self.enabled:
+            yield
+            return
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.mark(label, start)
+
+    def report(self) -> None:
+        """以表格形式输出记录的阶段（按结束时间排序，仅输出一次）"""
+        if not self.enabled or self.reported:
+            return
+        self.reported = True
+
+        def pad(text, width):
+            # 中文字符按两个字符宽度对齐
+            display_width = sum(2 if ord(ch) > 0x2e80 else 1 for ch in text)
+            return text + ' ' * max(0, width - display_width)
+
+        print(f"{pad('阶段', 36)}{pad('开始(ms)', 10)}{pad('结束(ms)', 10)}{pad('耗时(ms)', 10)}线程")
+        print('-' * 76)
+        for label, start, duration, thread in sorted(self.records, key=lambda r: r[1] + r[2]):
+            begin_ms = (start - STARTUP_TIME) * 1000
+            end_ms = begin_ms + duration * 1000
+            thread_name = '' if thread == main_thread().name else thread
+            print(f"{pad(label, 36)}{begin_ms:<10.1f}{end_ms:<10.1f}{duration * 1000:<10.1f}{thread_name}")
+
+# 创建全局启动耗时分析器实例
+global_startup_profiler = StartupProfiler(enabled='--startup-profile' in sys.argv)
+
 # 工具函数类
 class Utils:
     """游戏工具函数集合"""
@@ -293,12 +734,72 @@ class Utils:
         if global_debug:
             print(*args, **kwargs)
     
+    @staticmethod
+    def cli_int(name: str, default: int) -> int:
+        """读取形如 `--name 值` 的整数命令行参数，缺失或无效时返回默认值"""
+        if name in sys.argv:
+            index = sys.argv.index(name)
+            try:
+                return int(sys.argv[index + 1])
+            except (IndexError, ValueError):
+                Utils.error(f"参数 {name} 需要一个整数，使用默认值 {default}")
+        return default
+    
+    @staticmethod
+    def cli_str(name: str, default: str) -> str:
+        """读取形如 `--name 值` 的命令行参数，缺失时返回默认值"""
+        if name in sys.argv:
+            index = sys.argv.index(name)
+            if index + 1 < len(sys.argv) and not sys.argv[index + 1].startswith('--'):
+                return sys.argv[index + 1]
+        return default
+    
     @staticmethod
     def make_pixel_sprite(w: int, h: int, color: Tuple[int, int, int], scale: int = 3) -> pygame.Surface:
         """生成一个像素风格的 Surface：先创建小尺寸再放大保持像素感"""
         surf = pygame.Surface((w, h), pygame.SRCALPHA)
         surf.fill(color)
-        return pygame.transform.scale(surf, (w * scale, h * scale))
+        return Utils.optimize_surface(pygame.transform.scale(surf, (w * scale, h * scale)))[0]
+    
+    @staticmethod
+    def classify_surface(surf: pygame.Surface) -> str:
+        """根据透明度分布判断表面适合的格式
+
+        Returns:
+            'opaque'：完全不透明，转换为不带 alpha 的显示格式；
+            'rle'：透明像素多、半透明像素少，使用 RLE 加速的 alpha 表面；
+            'alpha'：其余情况，使用普通的逐像素 alpha 表面
+        """
+        w, h = surf.get_size()
+        total = w * h
+        if total == 0:
+            return 'alpha'
+        if not surf.get_flags() & pygame.SRCALPHA and surf.get_colorkey() is None:
+            return 'opaque'
+        opaque = pygame.mask.from_surface(surf, 254).count()
+        if opaque == total:
+            return 'opaque'
+        transparent = total - pygame.mask.from_surface(surf, 0).count()
+        partial = total - opaque - transparent
+        if transparent / total >= RLE_MIN_TRANSPARENT and partial / total <= RLE_MAX_PARTIAL:
+            return 'rle'
+        return 'alpha'
+    
+    @staticmethod
+    def optimize_surface(surf: pygame.Surface) -> Tuple[pygame.Surface, str]:
+        """按 classify_surface 的结果转换表面格式，返回 (表面, 格式)
+
+        尚未创建显示窗口时无法转换，原样返回并标记为 'raw'。
+        """
+        if pygame.display.get_surface() is None:
+            return surf, 'raw'
+        kind = Utils.classify_surface(surf)
+        if kind == 'opaque':
+            return surf.convert(), kind
+        surf = surf.convert_alpha()
+        if kind == 'rle':
+            surf.set_alpha(255, pygame.RLEACCEL)
+        return surf, kind
     
     @staticmethod
     def load_image(name: str, target_size: Optional[Tuple[int, int]] = None) -> pygame.Surface:
@@ -324,7 +825,24 @@ class Utils:
             ]
             pygame.draw.polygon(surf, COLOR_LIGHT_BLUE, points)
             pygame.draw.polygon(surf, COLOR_MEDIUM_BLUE, points, 2)
-            return surf
+            return Utils.optimize_surface(surf)[0]
+    
+    @staticmethod
+    def decode_image(name: str, target_size: Tuple[int, int]) -> Optional[pygame.Surface]:
+        """解码 assets/images/ 中的 png 并缩放到 target_size，不做显示格式转换，可在工作线程中调用
+
+        Returns:
+            32 位 RGBA 表面，加载失败时返回 None
+        """
+        path = os.path.join(ASSETS_IMG, f"{name}.png")
+        try:
+            loaded = pygame.image.load(path)
+        except Exception:
+            return None
+        # 先绘制到 32 位 RGBA 表面上，保证 smoothscale 可用且透明信息不丢失
+        img = pygame.Surface(loaded.get_size(), pygame.SRCALPHA)
+        img.blit(loaded, (0, 0))
+        return pygame.transform.smoothscale(img, target_size)
     
     @staticmethod
     def load_sound(name: str) -> Optional[pygame.mixer.Sound]:
@@ -372,33 +890,21 @@ class Utils:
     
     @staticmethod
     def play_sound(sound: Optional[pygame.mixer.Sound], game: Optional[Any] = None) -> None:
-        """安全地播放音效，支持音量设置"""
+        """安全地播放音效
+
+        音量由 AudioManager 在音量设置变化时统一应用，这里不再每次播放都设置；
+        game 参数保留以兼容现有调用。
+        """
         if sound:
             try:
-        
-                if game and game.ui_manager:
-                    sound_volume = game.ui_manager.volume_settings['sound']['value'] / 100
-                    master_volume = game.ui_manager.volume_settings['master']['value'] / 100
-                    # 应用主音量和音效音量的乘积
-                    sound.set_volume(sound_volume * master_volume)
-                sound.play()
+                global_audio_manager.play(sound)
             except Exception:
                 pass
     
     @staticmethod
     def draw_blurred_background(screen: pygame.Surface, alpha: int = 200) -> None:
-        """创建并绘制模糊背景"""
-        try:
-            snap = screen.copy()
-            small = pygame.transform.smoothscale(snap, (max(1, SCREEN_W // 8), max(1, SCREEN_H // 8)))
-            blurred = pygame.transform.smoothscale(small, (SCREEN_W, SCREEN_H))
-            blurred.set_alpha(alpha)
-            screen.blit(blurred, (0, 0))
-        except Exception:
-            # 若模糊失败，使用一个半透明暗覆盖
-            overlay = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, alpha))
-            screen.blit(overlay, (0, 0))
+        """创建并绘制模糊背景（不缓存，需要每帧复用时请使用 BlurredBackdrop）"""
+        BlurredBackdrop(8).draw(screen, alpha, None)
     
     @staticmethod
     def save_data(data: Dict[str, Any], file_path: str) -> None:
@@ -444,9 +950,614 @@ class Utils:
                 return str(num)
             # 对于浮点数保留两位小数
             return f"{num:.2f}"
+class AssetPack:
+    """预烘焙资源包
+
+    文件结构：头部（魔数、版本、索引长度）+ JSON 索引 + 原始数据。
+    图片已缩放到运行时尺寸并以 RGBA 字节保存，音效以混音器格式的原始采样保存。
+    运行时通过 mmap 打开，图片由 pygame.image.frombuffer 直接构造，无需 PNG 解码和缩放。
+    索引中记录了每个源文件的哈希，任一源文件变化即视为资源包过期。
+    """
+    MAGIC = b'PWAP'
+    VERSION = 1
+    HEADER = struct.Struct('<4sII')  # 魔数、版本、索引长度
+
+    def __init__(self, path: str, mm: mmap.mmap, index: Dict[str, Any], data_offset: int):
+        self.path = path
+        self._mmap = mm
+        self._data_offset = data_offset
+        self.images: Dict[str, List[int]] = index['images']
+        self.sounds: Dict[str, List[int]] = index['sounds']
+
+    @staticmethod
+    def image_key(name: str, size: Tuple[int, int]) -> str:
+        """图片在索引中的键"""
+        return f"{name}@{size[0]}x{size[1]}"
+
+    @staticmethod
+    def hash_file(path: str) -> str:
+        """计算源文件的哈希"""
+        with open(path, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()
+
+    @classmethod
+    def open(cls, path: str = ASSET_PACK_PATH) -> Optional['AssetPack']:
+        """打开资源包，文件不存在、格式不符或已过期时返回 None"""
+        if not os.path.isfile(path):
+            return None
+        try:
+            with open(path, 'rb') as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception as e:
+            Utils.debug(f"无法打开资源包 {path}: {e}")
+            return None
+        try:
+            magic, version, index_len = cls.HEADER.unpack_from(mm, 0)
+            if magic != cls.MAGIC or version != cls.VERSION:
+                Utils.debug("资源包版本不匹配，使用原始资源")
+                mm.close()
+                return None
+            index_start = cls.HEADER.size
+            index = json.loads(mm[index_start:index_start + index_len].decode('utf-8'))
+            for rel_path, digest in index['sources'].items():
+                src = os.path.join(ASSETS, rel_path)
+                if not os.path.isfile(src) or cls.hash_file(src) != digest:
+                    Utils.debug(f"资源包已过期（{rel_path} 已变化），使用原始资源")
+                    mm.close()
+                    return None
+            return cls(path, mm, index, index_start + index_len)
+        except Exception as e:
+            Utils.debug(f"资源包损坏: {e}")
+            mm.close()
+            return None
+
+    def image(self, name: str, size: Optional[Tuple[int, int]], convert: bool = True) -> Optional[pygame.Surface]:
+        """从资源包构造图片，包内没有对应尺寸时返回 None
+
+        Args:
+            convert: 是否转换为显示格式；为 False 时返回独立的 RGBA 副本，可在工作线程中调用
+        """
+        if size is None:
+            return None
+        entry = self.images.get(self.image_key(name, size))
+        if entry is None:
+            return None
+        offset, w, h = entry
+        start = self._data_offset + offset
+        view = memoryview(self._mmap)[start:start + w * h * 4]
+        try:
+            # frombuffer 直接引用映射内存，复制（或转换为显示格式）后即可释放
+            surf = pygame.image.frombuffer(view, (w, h), 'RGBA')
+            return surf.convert_alpha() if convert else surf.copy()
+        finally:
+            view.release()
+
+    def sound(self, name: str) -> Optional[pygame.mixer.Sound]:
+        """从资源包构造音效，混音器格式与烘焙时不一致时返回 None"""
+        entry = self.sounds.get(name)
+        if entry is None:
+            return None
+        offset, length, frequency, fmt, channels = entry
+        if pygame.mixer.get_init() != (frequency, fmt, channels):
+            return None
+        start = self._data_offset + offset
+        return pygame.mixer.Sound(buffer=self._mmap[start:start + length])
+
+    @classmethod
+    def bake(cls, path: str = ASSET_PACK_PATH) -> None:
+        """将 BAKED_IMAGES 中的图片和全部音效写入资源包"""
+        sources: Dict[str, str] = {}
+        images: Dict[str, List[int]] = {}
+        sounds: Dict[str, List[int]] = {}
+        blobs: List[bytes] = []
+        offset = 0
+
+        for name, size in BAKED_IMAGES:
+            src = os.path.join(ASSETS_IMG, f"{name}.png")
+            img = Utils.decode_image(name, size) if os.path.isfile(src) else None
+            if img is None:
+                Utils.error(f"跳过无法加载的图片: {src}")
+                continue
+            data = pygame.image.tobytes(img, 'RGBA')
+            images[cls.image_key(name, size)] = [offset, size[0], size[1]]
+            sources[os.path.relpath(src, ASSETS).replace(os.sep, '/')] = cls.hash_file(src)
+            blobs.append(data)
+            offset += len(data)
+
+        mixer_format = pygame.mixer.get_init()
+        if mixer_format and os.path.isdir(ASSETS_SFX):
+            for filename in sorted(os.listdir(ASSETS_SFX)):
+                if not filename.endswith('.wav'):
+                    continue
+                src = os.path.join(ASSETS_SFX, filename)
+                try:
+                    data = pygame.mixer.Sound(src).get_raw()
+                except Exception as e:
+                    Utils.error(f"跳过无法加载的音效 {src}: {e}")
+                    continue
+                sounds[filename[:-4]] = [offset, len(data)] + list(mixer_format)
+                sources[os.path.relpath(src, ASSETS).replace(os.sep, '/')] = cls.hash_file(src)
+                blobs.append(data)
+                offset += len(data)
+        else:
+            Utils.error("音频模块不可用，资源包中不包含音效")
+
+        index = json.dumps({'sources': sources, 'images': images, 'sounds': sounds}).encode('utf-8')
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, len(index)))
+            f.write(index)
+            for data in blobs:
+                f.write(data)
+        os.replace(tmp_path, path)
+        print(f"资源包已生成: {path}（{len(images)} 张图片, {len(sounds)} 个音效, {offset / 1024:.0f} KiB）")
+
+class TextureAtlas:
+    """纹理图集
+
+    将多张精灵按架子（shelf）算法打包到同一张表面上，
+    对外提供子表面或 (图集, 区域) 供 Surface.blits 批量绘制。
+    """
+    PADDING = 1  # 精灵之间留出的间隔，避免缩放或旋转时采样到相邻精灵
+
+    def __init__(self, max_width: int = ATLAS_MAX_WIDTH):
+        self.max_width = max_width
+        self.surface: Optional[pygame.Surface] = None
+        self.regions: Dict[Any, pygame.Rect] = {}
+        self._subsurfaces: Dict[Any, pygame.Surface] = {}
+
+    def build(self, sprites: Dict[Any, pygame.Surface]) -> None:
+        """打包精灵，sprites 为 {键: 表面}"""
+        pad = self.PADDING
+        # 按高度从高到低排列，同一架子上的精灵高度接近，浪费的空间更少
+        order = sorted(sprites.items(), key=lambda item: item[1].get_height(), reverse=True)
+        regions = {}
+        x = y = shelf_h = 0
+        width = 0
+        for key, img in order:
+            w, h = img.get_size()
+            if x > 0 and x + w > self.max_width:
+                # 当前架子放不下，另起一层
+                y += shelf_h + pad
+                x = shelf_h = 0
+            regions[key] = pygame.Rect(x, y, w, h)
+            x += w + pad
+            shelf_h = max(shelf_h, h)
+            width = max(width, x - pad)
+        height = y + shelf_h
+
+        self.surface = pygame.Surface((max(1, width), max(1, height)), pygame.SRCALPHA)
+        self.surface.fill((0, 0, 0, 0))
+        self.surface.blits([(sprites[key], rect) for key, rect in regions.items()], doreturn=False)
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha()
+        self.regions = regions
+        self._subsurfaces = {key: self.surface.subsurface(rect) for key, rect in regions.items()}
+
+    def get(self, key: Any) -> Optional[pygame.Surface]:
+        """获取精灵对应的子表面"""
+        return self._subsurfaces.get(key)
+
+    def region(self, key: Any) -> Optional[Tuple[pygame.Surface, pygame.Rect]]:
+        """获取 (图集表面, 精灵区域)，可作为 blits 的 (source, dest, area) 使用"""
+        rect = self.regions.get(key)
+        if rect is None:
+            return None
+        return self.surface, rect
+
+    def usage(self) -> float:
+        """图集面积利用率"""
+        if self.surface is None:
+            return 0.0
+        used = sum(rect.w * rect.h for rect in self.regions.values())
+        return used / (self.surface.get_width() * self.surface.get_height())
+
+class AssetCache:
+    """图片资源缓存
+
+    以 (名称, 尺寸) 为键保存已解码、已转换并缩放好的图片，
+    实体构造时直接取用，生成实体不再产生磁盘读取和缩放开销。
+    挂载了资源包时优先从资源包构造，资源包中没有的再回退到 PNG。
+    """
+    def __init__(self):
+        self._images: Dict[Tuple[str, Optional[Tuple[int, int]]], pygame.Surface] = {}
+        self._sounds: Dict[str, Optional[pygame.mixer.Sound]] = {}
+        self.pack: Optional[AssetPack] = None
+        self.atlas: Optional[TextureAtlas] = None
+        self.formats: Dict[Tuple[str, Optional[Tuple[int, int]]], str] = {}  # 每张图片最终使用的表面格式
+        self.hits = 0
+        self.misses = 0
+        self.pack_loads = 0
+
+    def get_image(self, name: str, size: Optional[Tuple[int, int]] = None) -> pygame.Surface:
+        """获取图片，首次请求时通过 Utils.load_image 加载"""
+        key = (name, tuple(size) if size is not None else None)
+        img = self._images.get(key)
+        if img is None:
+            self.misses += 1
+            with global_startup_profiler.section(f"图片 {name}"):
+                if self.pack is not None:
+                    img = self.pack.image(name, key[1])
+                if img is not None:
+                    self.pack_loads += 1
+                else:
+                    img = Utils.load_image(name, key[1])
+                img, self.formats[key] = Utils.optimize_surface(img)
+            self._images[key] = img
+        else:
+            self.hits += 1
+        return img
+
+    def build_atlas(self, entries: List[Tuple[str, Tuple[int, int]]]) -> TextureAtlas:
+        """将 entries 中逐像素 alpha 的图片打包进纹理图集，此后 get_image 返回图集中的子表面
+
+        图集本身是逐像素 alpha 表面，被分类为不透明或 RLE 的图片放进去会丢掉更快的格式，
+        因此这些图片不进图集，继续使用各自的独立表面。
+        """
+        keys = [(name, tuple(size)) for name, size in entries]
+        sprites = {}
+        for key in keys:
+            img = self.get_image(*key)
+            if self.formats.get(key) in ('alpha', 'raw'):
+                sprites[key] = img
+        atlas = TextureAtlas()
+        atlas.build(sprites)
+        for key in sprites:
+            self._images[key] = atlas.get(key)
+            self.formats[key] = 'alpha (atlas)'
+        self.atlas = atlas
+        return atlas
+
+    def get_region(self, name: str, size: Tuple[int, int]) -> Optional[Tuple[pygame.Surface, pygame.Rect]]:
+        """获取图片在纹理图集中的 (图集表面, 区域)，不在图集中时返回 None"""
+        if self.atlas is None:
+            return None
+        return self.atlas.region((name, tuple(size)))
+
+    def put_image(self, name: str, size: Tuple[int, int], img: pygame.Surface) -> None:
+        """放入在别处（如后台加载器）准备好的图片，放入前统一转换表面格式"""
+        key = (name, tuple(size))
+        self._images[key], self.formats[key] = Utils.optimize_surface(img)
+
+    def has_image(self, name: str, size: Tuple[int, int]) -> bool:
+        """图片是否已在缓存中"""
+        return (name, tuple(size)) in self._images
+
+    def load_sound(self, name: str) -> Optional[pygame.mixer.Sound]:
+        """加载音效但不放入缓存，优先从资源包读取，可在工作线程中调用"""
+        if self.pack is not None:
+            try:
+                snd = self.pack.sound(name)
+            except Exception:
+                snd = None
+            if snd is not None:
+                self.pack_loads += 1
+                return snd
+        return Utils.load_sound(name)
+
+    def put_sound(self, name: str, snd: Optional[pygame.mixer.Sound]) -> None:
+        """放入在别处准备好的音效"""
+        self._sounds[name] = snd
+
+    def get_sound(self, name: str) -> Optional[pygame.mixer.Sound]:
+        """获取音效，首次请求时加载"""
+        if name not in self._sounds:
+            with global_startup_profiler.section(f"音效 {name}"):
+                self._sounds[name] = self.load_sound(name)
+        return self._sounds[name]
+
+    def clear(self) -> None:
+        """清空缓存和计数"""
+        self._images.clear()
+        self._sounds.clear()
+        self.formats.clear()
+        self.atlas = None
+        self.hits = 0
+        self.misses = 0
+        self.pack_loads = 0
+
+    def report(self) -> str:
+        """返回缓存命中情况的描述"""
+        total = self.hits + self.misses
+        rate = self.hits / total * 100 if total else 0.0
+        return (f"资源缓存: {len(self._images)} 张图片, 命中 {self.hits}, 未命中 {self.misses} ({rate:.1f}% 命中), "
+                f"从资源包加载 {self.pack_loads} 项")
+
+# 创建全局资源缓存实例
+global_asset_cache = AssetCache()
+
+class AudioManager:
+    """音效播放管理
+
+    使用固定数量的混音通道，每个音效有优先级和最大同时发声数：
+    同一音效达到上限时抢占它最早开始的一个发声；没有空闲通道时抢占优先级更低的发声，
+    都不满足则丢弃本次播放。音量 x 每个音效的增益只在设置变化时应用。
+    混音器只在这里初始化一次，缓冲区大小和通道数可配置。
+    """
+    def __init__(self):
+        self.channels: List[pygame.mixer.Channel] = []
+        self.volume = 1.0
+        self.frequency = AUDIO_FREQUENCY
+        self.buffer = AUDIO_BUFFER
+        self.channel_count = AUDIO_CHANNELS
+        self._profiles: Dict[pygame.mixer.Sound, Tuple[int, int, float]] = {}
+        self._voices: List[Optional[Tuple[pygame.mixer.Sound, int, int]]] = []  # 每个通道上的 (音效, 优先级, 序号)
+        self._serial = 0
+        self.played = 0
+        self.stolen = 0
+        self.dropped = 0
+        # 播放调用耗时统计（秒）
+        self.play_time_total = 0.0
+        self.play_time_max = 0.0
+
+    def configure(self, buffer: int = AUDIO_BUFFER, channel_count: int = AUDIO_CHANNELS,
+                  frequency: int = AUDIO_FREQUENCY) -> None:
+        """在 pygame.init() 之前设置混音器参数，使 pygame.init() 直接按此配置初始化混音器"""
+        self.buffer = buffer
+        self.channel_count = channel_count
+        self.frequency = frequency
+        pygame.mixer.pre_init(frequency=frequency, size=-16, channels=2, buffer=buffer)
+
+    def init(self) -> bool:
+        """确保混音器已初始化并建立通道池，返回音频是否可用"""
+        if not pygame.mixer.get_init():
+            try:
+                pygame.mixer.init(frequency=self.frequency, size=-16, channels=2, buffer=self.buffer)
+            except pygame.error as e:
+                Utils.error(f"音频初始化失败: {e}")
+                self.channels = []
+                self._voices = []
+                return False
+        if len(self.channels) != self.channel_count:
+            pygame.mixer.set_num_channels(self.channel_count)
+            self.channels = [pygame.mixer.Channel(i) for i in range(self.channel_count)]
+            self._voices = [None] * self.channel_count
+        return True
+
+    def buffer_latency_ms(self) -> float:
+        """混音器缓冲区带来的输出延迟（毫秒）"""
+        return self.buffer / self.frequency * 1000
+
+    def register(self, name: Optional[str], sound: Optional[pygame.mixer.Sound]) -> None:
+        """登记音效的播放配置，并应用当前音量"""
+        if sound is None:
+            return
+        profile = SOUND_PROFILES.get(name, DEFAULT_SOUND_PROFILE)
+        self._profiles[sound] = profile
+        sound.set_volume(self.volume * profile[2])
+
+    def set_volume(self, volume: float) -> None:
+        """设置音效总音量（主音量 x 音效音量），并按增益应用到每个音效"""
+        self.volume = volume
+        for sound, profile in self._profiles.items():
+            sound.set_volume(volume * profile[2])
+
+    def play(self, sound: pygame.mixer.Sound) -> None:
+        """按优先级和发声数限制在通道池中播放音效"""
+        if not self.channels:
+            return
+        start = perf_counter()
+        profile = self._profiles.get(sound)
+        if profile is None:
+            self.register(None, sound)
+            profile = self._profiles[sound]
+        priority, max_voices = profile[0], profile[1]
+        if global_quality_governor.reduces(QUALITY_LIMIT_VOICES):
+            max_voices = 1
+
+        free = None
+        same = []
+        victim = None
+        for i, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                if free is None:
+                    free = i
+                continue
+            voice = self._voices[i]
+            if voice is None:
+                continue
+            if voice[0] is sound:
+                same.append(i)
+            elif voice[1] < priority and (victim is None or voice[1:] < self._voices[victim][1:]):
+                # 记录优先级最低、开始最早的发声作为候选
+                victim = i
+
+        if len(same) >= max_voices:
+            index = min(same, key=lambda i: self._voices[i][2])
+            self.stolen += 1
+        elif free is not None:
+            index = free
+        elif victim is not None:
+            index = victim
+            self.stolen += 1
+        else:
+            self.dropped += 1
+            return
+
+        self.channels[index].play(sound)
+        self._voices[index] = (sound, priority, self._serial)
+        self._serial += 1
+        self.played += 1
+        elapsed = perf_counter() - start
+        self.play_time_total += elapsed
+        if elapsed > self.play_time_max:
+            self.play_time_max = elapsed
+
+    def report(self) -> str:
+        """返回播放统计的描述"""
+        return f"音效: 播放 {self.played}, 抢占 {self.stolen}, 丢弃 {self.dropped}, 通道 {len(self.channels)}"
+
+    def profile_lines(self) -> List[str]:
+        """性能面板中显示的音频信息"""
+        avg_us = self.play_time_total / self.played * 1e6 if self.played else 0.0
+        return [
+            f"音频缓冲: {self.buffer} 帧 ({self.buffer_latency_ms():.1f} ms) @ {self.frequency} Hz",
+            f"播放调用: 平均 {avg_us:.1f} us, 最大 {self.play_time_max * 1e6:.1f} us",
+            self.report(),
+        ]
+
+# 创建全局音效管理器实例
+global_audio_manager = AudioManager()
+
+class AssetLoader:
+    """后台资源加载器
+
+    在工作线程中解码图片、缩放并加载音效；显示格式转换必须在主线程进行，
+    因此主线程每帧调用 poll()，解码完成后再转换并放入资源缓存。
+    需要立即使用资源时（例如玩家在加载完成前点击开始）调用 wait() 阻塞等待。
+    """
+    def __init__(self, cache: AssetCache):
+        self.cache = cache
+        self.ready = False
+        self.load_seconds = 0.0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._future: Optional[Future] = None
+        self._on_ready: Optional[Callable[[], None]] = None
+        self._started_at = 0.0
+
+    def start(self, images: List[Tuple[str, Tuple[int, int]]], sounds: List[str],
+              on_ready: Optional[Callable[[], None]] = None) -> None:
+        """开始在后台加载 images 和 sounds，全部就绪后在主线程调用 on_ready"""
+        self._on_ready = on_ready
+        self._started_at = perf_counter()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='asset-loader')
+        self._future = self._executor.submit(self._decode, list(images), list(sounds))
+
+    def _decode(self, images, sounds):
+        """工作线程：解码图片和音效，不涉及显示格式转换"""
+        decoded_images = {}
+        for name, size in images:
+            if self.cache.has_image(name, size):
+                continue
+            with global_startup_profiler.section(f"解码图片 {name}"):
+                surf = None
+                if self.cache.pack is not None:
+                    surf = self.cache.pack.image(name, size, convert=False)
+                if surf is None:
+                    surf = Utils.decode_image(name, size)
+            decoded_images[(name, tuple(size))] = surf
+        decoded_sounds = {}
+        for name in sounds:
+            with global_startup_profiler.section(f"解码音效 {name}"):
+                decoded_sounds[name] = self.cache.load_sound(name)
+        return decoded_images, decoded_sounds
+
+    def poll(self) -> bool:
+        """主线程每帧调用，后台解码完成后收尾，返回资源是否已就绪"""
+        if not self.ready and self._future is not None and self._future.done():
+            self._finish()
+        return self.ready
+
+    def wait(self) -> None:
+        """阻塞直到资源就绪"""
+        if not self.ready and self._future is not None:
+            if not self._future.done():
+                Utils.debug("资源仍在后台加载，等待加载完成...")
+            self._finish()
+
+    def _finish(self):
+        """主线程：转换显示格式并放入资源缓存"""
+        try:
+            decoded_images, decoded_sounds = self._future.result()
+        except Exception as e:
+            # 后台加载失败时不放入任何结果，之后按需同步加载
+            Utils.error(f"后台资源加载失败: {e}")
+            decoded_images, decoded_sounds = {}, {}
+        for (name, size), surf in decoded_images.items():
+            if surf is not None:
+                self.cache.put_image(name, size, surf)
+        for name, snd in decoded_sounds.items():
+            self.cache.put_sound(name, snd)
+        self._executor.shutdown(wait=False)
+        self._executor = None
+        self.ready = True
+        self.load_seconds = perf_counter() - self._started_at
+        global_startup_profiler.mark('后台资源加载', self._started_at)
+        Utils.debug(f"后台资源加载完成，耗时 {self.load_seconds * 1000:.1f} ms")
+        if self._on_ready is not None:
+            self._on_ready()
+
+class BlurredBackdrop:
+    """模糊背景快照
+
+    遮罩打开时（或下层画面发生变化时）对屏幕做一次缩小再放大的模糊，
+    之后每帧复用同一张模糊图，淡入淡出只修改透明度。
+    """
+    def __init__(self, downscale: int):
+        self.downscale = downscale  # 缩小倍数，越大越模糊
+        self.surface: Optional[pygame.Surface] = None  # 缓存的模糊图
+        self.scene_key: Any = None  # 生成快照时下层画面的标识
+
+    def reset(self) -> None:
+        """丢弃快照，下次绘制时重新截取"""
+        self.surface = None
+
+    def draw(self, screen: pygame.Surface, alpha: int, scene_key: Any) -> None:
+        """绘制模糊背景
+
+        Args:
+            screen: 目标表面，同时也是截图来源
+            alpha: 模糊图的透明度
+            scene_key: 下层画面的标识，与快照生成时不同则重新模糊
+        """
+        if global_quality_governor.reduces(QUALITY_FLAT_OVERLAY):
+            # 画质降级时不做模糊，直接暗化
+            self._draw_flat(screen, alpha)
+            return
+        try:
+            if self.surface is None or scene_key != self.scene_key:
+                small = pygame.transform.smoothscale(screen, (max(1, SCREEN_W // self.downscale), max(1, SCREEN_H // self.downscale)))
+                self.surface = pygame.transform.smoothscale(small, (SCREEN_W, SCREEN_H))
+                self.scene_key = scene_key
+            self.surface.set_alpha(alpha)
+            screen.blit(self.surface, (0, 0))
+        except Exception:
+            # 若模糊失败，使用一个半透明暗覆盖
+            self._draw_flat(screen, alpha)
+
+    @staticmethod
+    def _draw_flat(screen: pygame.Surface, alpha: int) -> None:
+        """绘制半透明的纯色暗化覆盖"""
+        overlay = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, alpha))
+        screen.blit(overlay, (0, 0))
+class BackgroundLayer:
+    """滚动背景层
+
+    把背景图上下拼接成一张 SCREEN_W x 2*SCREEN_H 的表面，
+    每帧只按滚动偏移量取其中一个屏幕大小的区域绘制一次。滚动由模拟时间 dt 驱动，与帧率无关。
+    """
+    def __init__(self, image: Optional[pygame.Surface], speed: float = BG_SCROLL_SPEED):
+        self.speed = speed  # 每秒滚动的像素数
+        self.offset = 0.0  # 当前滚动偏移量（0 ~ SCREEN_H）
+        self.tiled = pygame.Surface((SCREEN_W, SCREEN_H * 2))
+        self.tiled.fill(COLOR_NAVY_BLUE)
+        if image is not None:
+            self.tiled.blit(image, (0, 0))
+            self.tiled.blit(image, (0, SCREEN_H))
+        if pygame.display.get_surface() is not None:
+            self.tiled = self.tiled.convert()
+
+    def update(self, dt: float) -> None:
+        """按模拟时间推进滚动"""
+        self.offset = (self.offset + self.speed * dt) % SCREEN_H
+
+    def scroll_key(self) -> int:
+        """当前画面对应的整数滚动位置，用于判断画面是否变化"""
+        return int(self.offset)
+
+    def draw(self, screen: pygame.Surface, offset: Optional[float] = None) -> None:
+        """绘制背景，offset 为 None 时使用当前滚动偏移量"""
+        scroll = int(self.offset if offset is None else offset) % SCREEN_H
+        # 屏幕第 y 行显示原图第 (y - scroll) 行，对应拼接表面中从 SCREEN_H - scroll 开始的区域
+        screen.blit(self.tiled, (0, 0), (0, SCREEN_H - scroll, SCREEN_W, SCREEN_H))
+
 # 游戏对象类
 class Bullet:
     """子弹类"""
+    # 旋转后子弹图像的缓存，键为 (原图, 角度)，散射角度是离散的，缓存规模很小
+    _rotation_cache: Dict[Tuple[pygame.Surface, float], pygame.Surface] = {}
+
     def __init__(self, x, y, vy, owner, image=None, damage=100, shoot_type=SHOOT_TYPE_DIRECT, angle=0):
         global object_id
         self.x = x
@@ -492,19 +1603,26 @@ class Bullet:
             if (self.owner == BULLET_OWNER_PLAYER and self.y < -self.h) or (self.owner == BULLET_OWNER_ENEMY and self.y > SCREEN_H):
                 self.alive = False
 
+    def blit_item(self):
+        """返回用于批量绘制的 (surface, 位置)，没有图片时返回 None"""
+        if not self.image:
+            return None
+        # 如果子弹有角度，使用旋转后的图像
+        if self.angle != 0:
+            key = (self.image, self.angle)
+            rotated_image = Bullet._rotation_cache.get(key)
+            if rotated_image is None:
+                # 负号是因为pygame旋转是逆时针的
+                rotated_image = pygame.transform.rotate(self.image, -self.angle)
+                Bullet._rotation_cache[key] = rotated_image
+            center = (self.x + self.w / 2, self.y + self.h / 2)
+            return rotated_image, rotated_image.get_rect(center=center).topleft
+        # 没有角度，直接绘制原图
+        return self.image, (self.x, self.y)
+
     def draw(self, surf):
         if self.image:
-            # 如果子弹有角度，旋转图像
-            if self.angle != 0:
-                # 旋转图像
-                rotated_image = pygame.transform.rotate(self.image, -self.angle)  # 负号是因为pygame旋转是逆时针的
-        
-                rotated_rect = rotated_image.get_rect(center=self.rect.center)
-                # 绘制旋转后的图像
-                surf.blit(rotated_image, rotated_rect.topleft)
-            else:
-                # 没有角度，直接绘制原图
-                surf.blit(self.image, (self.x, self.y))
+            surf.blit(*self.blit_item())
         else:
             color = (255, 220, 60) if self.owner == BULLET_OWNER_PLAYER else (255, 80, 80)
             pygame.draw.rect(surf, color, self.rect)
@@ -717,6 +1835,10 @@ class Player:
         
         return bullets
 
+    def blit_item(self):
+        """返回用于批量绘制的 (surface, 位置)"""
+        return self.img, (self.x, self.y)
+
     def draw(self, surf):
         surf.blit(self.img, (self.x, self.y))
         
@@ -798,11 +1920,8 @@ class RandomEvent:
         self.x = x
         self.y = y
         # 加载随机事件图标
-        self.img = Utils.load_image('random_event', (64, 64))
         self.w, self.h = (64, 64)  # 固定的图标大小为64x64
-        if self.img:
-            # 确保图片缩放到正确的尺寸
-            self.img = pygame.transform.smoothscale(self.img, (self.w, self.h))
+        self.img = global_asset_cache.get_image('random_event', POWERUP_SIZE)
         self.rect = pygame.Rect(self.x, self.y, self.w, self.h)
         self.alive = True
         self.object_id = object_id
@@ -847,22 +1966,25 @@ class RandomEvent:
             if self.effect_progress >= 1.0:
                 self.show_effect = False
     
-    def draw(self, surf):
-        # 绘制随机事件图标
-        surf.blit(self.img, (self.x, self.y))
-        
-        # 绘制特效（光环效果）
-        if self.show_effect:
-            # 绘制脉冲光环
+    def blit_items(self):
+        """返回用于批量绘制的 (surface, 位置) 列表：图标及光环特效"""
+        # 随机事件图标
+        items = [(self.img, (self.x, self.y))]
+        
+        # 特效（光环效果），画质降级时不绘制
+        if self.show_effect and not global_quality_governor.reduces(QUALITY_NO_PULSE):
+            # 脉冲光环
             alpha = int(150 * (1 - self.effect_progress))
             radius = int(32 + 16 * self.effect_progress)
             
             # 创建一个临时的透明Surface
             effect_surf = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA)
             pygame.draw.circle(effect_surf, (255, 255, 255, alpha), (radius, radius), radius)
-            
-            # 绘制到主表面
-            surf.blit(effect_surf, (self.x + self.w//2 - radius, self.y + self.h//2 - radius))
+            items.append((effect_surf, (self.x + self.w//2 - radius, self.y + self.h//2 - radius)))
+        return items
+
+    def draw(self, surf):
+        surf.blits(self.blit_items(), doreturn=False)
 
 class PowerUp:
     """小道具基类"""
@@ -874,8 +1996,8 @@ class PowerUp:
         self.hp = 2000  # 所有道具的hp都是2000
         self.img = image if image else Utils.make_pixel_sprite(20, 20, COLOR_GREEN, scale=3)
         self.w, self.h = (64, 64)  # 固定的图标大小为64x64
-        if image:
-            # 确保图片缩放到正确的尺寸
+        if image and image.get_size() != (self.w, self.h):
+            # 确保图片缩放到正确的尺寸（缓存中的图片已是目标尺寸，无需再缩放）
             self.img = pygame.transform.smoothscale(image, (self.w, self.h))
         self.rect = pygame.Rect(self.x, self.y, self.w, self.h)
         self.alive = True
@@ -914,12 +2036,13 @@ class PowerUp:
             if self.effect_progress >= 1.0:
                 self.show_effect = False
     
-    def draw(self, surf):
-        # 绘制道具图标
-        surf.blit(self.img, (self.x, self.y))
+    def blit_items(self):
+        """返回用于批量绘制的 (surface, 位置) 列表：道具图标及圆环特效"""
+        # 道具图标
+        items = [(self.img, (self.x, self.y))]
         
-        # 绘制特效（绿色圆环）
-        if self.show_effect:
+        # 特效（绿色圆环），画质降级时不绘制
+        if self.show_effect and not global_quality_governor.reduces(QUALITY_NO_PULSE):
             # 计算圆环半径（从16到32）
             radius = 16 + (32 - 16) * self.effect_progress
             # 计算透明度（从255到0，确保逐渐变浅）
@@ -929,10 +2052,13 @@ class PowerUp:
             # 绘制绿色圆环，确保颜色是透明的
             pygame.draw.circle(temp_surf, (0, 255, 0, int(alpha)), (int(radius), int(radius)), int(radius), 2)
             
-            # 将临时surface绘制到游戏表面上
             center_x = self.x + self.w // 2
             center_y = self.y + self.h // 2
-            surf.blit(temp_surf, (center_x - radius, center_y - radius))
+            items.append((temp_surf, (center_x - radius, center_y - radius)))
+        return items
+
+    def draw(self, surf):
+        surf.blits(self.blit_items(), doreturn=False)
     
     def use(self, player, game):
         """抽象方法，由子类实现"""
@@ -942,7 +2068,7 @@ class SpeedPowerUp(PowerUp):
     def __init__(self, x, y, image=None):
 
         if image is None:
-            image = Utils.load_image('speed', (64, 64))
+            image = global_asset_cache.get_image('speed', POWERUP_SIZE)
         super().__init__(x, y, 'speed', image)
     
     def use(self, player, game):
@@ -956,7 +2082,7 @@ class SpeedPowerUp(PowerUp):
         def restore_speed():
             player.speed = original_speed
         
-        task = runTaskLater(restore_speed, 15000)
+        task = runTaskLater(restore_speed, 15000, scheduler=game.session_scope)
 
         return task
 class Shield:
@@ -1028,7 +2154,7 @@ class ShieldPowerUp(PowerUp):
     def __init__(self, x, y, image=None):
 
         if image is None:
-            image = Utils.load_image('shield', (64, 64))
+            image = global_asset_cache.get_image('shield', POWERUP_SIZE)
         super().__init__(x, y, 'shield', image)
     
     def use(self, player, game):
@@ -1047,7 +2173,7 @@ class HealPowerUp(PowerUp):
     def __init__(self, x, y, image=None):
 
         if image is None:
-            image = Utils.load_image('heal', (64, 64))
+            image = global_asset_cache.get_image('heal', POWERUP_SIZE)
         super().__init__(x, y, 'heal', image)
     
     def use(self, player, game):
@@ -1061,7 +2187,7 @@ class SuperRapidShootPowerUp(PowerUp):
     def __init__(self, x, y, image=None):
 
         if image is None:
-            image = Utils.load_image('super_rapid_shoot', (64, 64))
+            image = global_asset_cache.get_image('super_rapid_shoot', POWERUP_SIZE)
         super().__init__(x, y, 'super_rapid_shoot', image)
     
     def use(self, player, game):
@@ -1080,7 +2206,7 @@ class SuperRapidShootPowerUp(PowerUp):
             player.rapid_shots_per_second = original_shots_per_second
             game.allow_switch_shoot_type = True
         
-        task = runTaskLater(restore_shoot_settings, 15000)
+        task = runTaskLater(restore_shoot_settings, 15000, scheduler=game.session_scope)
         
         return task
 class SuperScatterShootPowerUp(PowerUp):
@@ -1088,7 +2214,7 @@ class SuperScatterShootPowerUp(PowerUp):
     def __init__(self, x, y, image=None):
 
         if image is None:
-            image = Utils.load_image('super_scatter_shoot', (64, 64))
+            image = global_asset_cache.get_image('super_scatter_shoot', POWERUP_SIZE)
         super().__init__(x, y, 'super_scatter_shoot', image)
     
     def use(self, player, game):
@@ -1107,7 +2233,7 @@ class SuperScatterShootPowerUp(PowerUp):
             game.bullets_piercing = False
             game.allow_switch_shoot_type = True
         
-        task = runTaskLater(restore_shoot_settings, 15000)
+        task = runTaskLater(restore_shoot_settings, 15000, scheduler=game.session_scope)
         
         return task
 class Enemy:
@@ -1277,6 +2403,10 @@ class Enemy:
 
         return bullets
 
+    def blit_item(self):
+        """返回用于批量绘制的 (surface, 位置)"""
+        return self.img, (self.x, self.y)
+
     def draw(self, surf):
         surf.blit(self.img, (self.x, self.y))
 class FloatingText:
@@ -1313,6 +2443,9 @@ class FloatingText:
         surf.blit(text, (self.x, self.y))
 class Explosion:
     """爆炸效果类"""
+    # 预烘焙的帧序列缓存，键为 (duration, max_radius)，同一预设的所有爆炸共享
+    _frame_cache: Dict[Tuple[float, int], List[Optional[pygame.Surface]]] = {}
+
     def __init__(self, x, y, duration=0.4, max_radius=28):
         self.x = x
         self.y = y
@@ -1320,23 +2453,385 @@ class Explosion:
         self.time = 0.0
         self.max_radius = max_radius
         self.alive = True
+        self.frames = Explosion.get_frames(duration, max_radius)
+        # 帧图像中心相对左上角的偏移
+        self.offset = max_radius + 1
+
+    @staticmethod
+    def get_frames(duration, max_radius):
+        """获取指定预设的帧序列，首次使用时按 FPS 烘焙一次"""
+        key = (duration, max_radius)
+        frames = Explosion._frame_cache.get(key)
+        if frames is not None:
+            return frames
+
+        frame_count = max(1, int(math.ceil(duration * FPS)))
+        size = max_radius * 2 + 2
+        center = (max_radius + 1, max_radius + 1)
+        frames = []
+        for i in range(frame_count):
+            t = i / frame_count
+            # 由小到大、由亮到暗
+            r = int(max_radius * t)
+            if r <= 0:
+                # 半径为0的帧不需要绘制
+                frames.append(None)
+                continue
+            color = (
+                255,
+                max(0, int(220 * (1 - t))),
+                max(0, int(80 * (1 - t)))
+            )
+            # 使用黑色作为透明色键，爆炸颜色的红色分量恒为255，不会与色键冲突
+            frame = pygame.Surface((size, size))
+            frame.fill(COLOR_BLACK)
+            pygame.draw.circle(frame, color, center, r)
+            frame.set_colorkey(COLOR_BLACK, pygame.RLEACCEL)
+            frames.append(frame)
+
+        Explosion._frame_cache[key] = frames
+        return frames
 
     def update(self, dt):
         self.time += dt
         if self.time >= self.duration:
             self.alive = False
 
+    def blit_item(self):
+        """返回当前帧的 (surface, 位置)，当前帧为空时返回 None"""
+        frame = self.frames[self.frame_index()]
+        if frame is None:
+            return None
+        return frame, (int(self.x) - self.offset, int(self.y) - self.offset)
+
     def draw(self, surf):
-        t = max(0.0, min(1.0, self.time / self.duration))
-        # 由小到大、由亮到暗
-        r = int(self.max_radius * t)
-        if r > 0:
-            color = (
-                255,
-                max(0, int(220 * (1 - t))),
-                max(0, int(80 * (1 - t)))
-            )
-            pygame.draw.circle(surf, color, (int(self.x), int(self.y)), r)
+        item = self.blit_item()
+        if item:
+            surf.blit(*item)
+
+    @staticmethod
+    def draw_all(surf, explosions):
+        """通过一次 Surface.blits 调用批量绘制所有爆炸"""
+        items = [item for item in (ex.blit_item() for ex in explosions) if item]
+        if items:
+            surf.blits(items, doreturn=False)
+
+    def frame_index(self):
+        """当前应显示的帧序号"""
+        frame_count = len(self.frames)
+        return min(frame_count - 1, max(0, int(self.time / self.duration * frame_count)))
+
+    def bounding_rect(self):
+        """爆炸帧在屏幕上的包围矩形"""
+        size = self.offset * 2
+        return pygame.Rect(int(self.x) - self.offset, int(self.y) - self.offset, size, size)
+class QualityGovernor:
+    """画质调节器
+
+    以指数滑动平均跟踪每帧实际耗时（不含帧率限制的等待）。持续接近帧预算时提升降级等级，
+    逐项关闭可选的视觉和音效开销；持续有充足余量时再逐级恢复。
+    """
+    STEPS = [
+        (QUALITY_NO_PULSE, '关闭脉冲特效'),
+        (QUALITY_FLAT_OVERLAY, '纯色遮罩'),
+        (QUALITY_LIMIT_FLOATING_TEXT, '限制浮动文字'),
+        (QUALITY_MERGE_EXPLOSIONS, '合并爆炸'),
+        (QUALITY_LIMIT_VOICES, '限制发声数'),
+    ]
+
+    def __init__(self, budget_ms: float = 1000 / FPS, degrade_ratio: float = 0.9, recover_ratio: float = 0.6,
+                 degrade_frames: int = 30, recover_frames: int = 180):
+        self.enabled = True
+        self.budget_ms = budget_ms  # 每帧的时间预算
+        self.degrade_ratio = degrade_ratio  # 平均耗时超过预算的该比例时视为压力
+        self.recover_ratio = recover_ratio  # 平均耗时低于预算的该比例时视为有余量
+        self.degrade_frames = degrade_frames  # 连续多少帧有压力才降级
+        self.recover_frames = recover_frames  # 连续多少帧有余量才恢复
+        self.level = 0  # 当前降级等级，0 表示全部效果开启
+        self.frame_ms = 0.0  # 平均帧耗时
+        self.changes = 0  # 等级变化次数
+        self._index = {step: i for i, (step, _) in enumerate(self.STEPS)}
+        self._over = 0
+        self._under = 0
+        self._text_window = 0.0
+        self._text_count = 0
+
+    def sample(self, work_ms: float) -> None:
+        """记录一帧的实际耗时（毫秒），按需调整等级"""
+        if not self.enabled:
+            return
+        self.frame_ms += (work_ms - self.frame_ms) * 0.1
+        if self.frame_ms > self.budget_ms * self.degrade_ratio:
+            self._over += 1
+            self._under = 0
+        elif self.frame_ms < self.budget_ms * self.recover_ratio:
+            self._under += 1
+            self._over = 0
+        else:
+            self._over = self._under = 0
+
+        if self._over >= self.degrade_frames and self.level < len(self.STEPS):
+            self.level += 1
+            self._over = 0
+            self.changes += 1
+            Utils.debug(f"画质降级到 {self.level}: {self.STEPS[self.level - 1][1]}（平均帧耗时 {self.frame_ms:.1f} ms）")
+        elif self._under >= self.recover_frames and self.level > 0:
+            self.level -= 1
+            self._under = 0
+            self.changes += 1
+            Utils.debug(f"画质恢复到 {self.level}（平均帧耗时 {self.frame_ms:.1f} ms）")
+
+    def reduces(self, step: str) -> bool:
+        """指定的步骤当前是否处于降级状态"""
+        return self.level > self._index[step]
+
+    def allow_floating_text(self) -> bool:
+        """是否允许新增浮动文字，限制浮动文字时每秒最多 FLOATING_TEXT_PER_SECOND 条"""
+        if not self.reduces(QUALITY_LIMIT_FLOATING_TEXT):
+            return True
+        now = time()
+        if now - self._text_window >= 1.0:
+            self._text_window = now
+            self._text_count = 0
+        if self._text_count >= FLOATING_TEXT_PER_SECOND:
+            return False
+        self._text_count += 1
+        return True
+
+    def profile_lines(self) -> List[str]:
+        """性能面板中显示的画质信息"""
+        lines = [f"画质等级: {self.level}/{len(self.STEPS)}  帧耗时 {self.frame_ms:.1f}/{self.budget_ms:.1f} ms"]
+        if self.level:
+            lines.append("已降级: " + '、'.join(name for _, name in self.STEPS[:self.level]))
+        return lines
+
+# 创建全局画质调节器实例
+global_quality_governor = QualityGovernor()
+
+class DirtyRectTracker:
+    """脏矩形跟踪器
+
+    每帧记录各绘制项（实体、HUD行、弹窗等）的包围矩形和外观签名，
+    与上一帧对比后只把发生变化的区域提交给 pygame.display.update。
+    背景滚动等导致整屏失效时退回到 pygame.display.flip。
+    """
+    def __init__(self, enabled=False):
+        self.enabled = enabled  # 是否启用脏矩形渲染模式
+        self._prev_items = {}  # 上一帧的绘制项：key -> (rect, signature)
+        self._items = {}  # 当前帧的绘制项
+        self._full_redraw = True  # 下一次提交是否整屏刷新
+        self.last_dirty_count = -1  # 上一帧提交的脏矩形数量，-1表示整屏刷新
+
+    def begin_frame(self):
+        """开始新的一帧"""
+        self._items = {}
+
+    def invalidate_all(self):
+        """标记整屏失效，下一次提交使用 flip"""
+        self._full_redraw = True
+
+    def track(self, key, rect, signature=None):
+        """记录一个绘制项
+
+        Args:
+            key: 绘制项的唯一标识，跨帧保持不变
+            rect: 绘制项在屏幕上的包围矩形
+            signature: 外观签名，签名或矩形变化时该区域被视为脏区域
+        """
+        if self.enabled:
+            # 向外扩展1像素，避免浮点坐标取整造成的残影
+            self._items[key] = (pygame.Rect(rect).inflate(2, 2), signature)
+
+    def present(self):
+        """提交当前帧到屏幕"""
+        if not self.enabled or self._full_redraw:
+            pygame.display.flip()
+            self.last_dirty_count = -1
+        else:
+            screen_rect = pygame.Rect(0, 0, SCREEN_W, SCREEN_H)
+            prev_items = self._prev_items
+            dirty = []
+            for key, (rect, signature) in self._items.items():
+                old = prev_items.get(key)
+                if old is None:
+                    dirty.append(rect)
+                elif old[0] != rect or old[1] != signature:
+                    dirty.append(rect)
+                    dirty.append(old[0])
+            for key, (rect, _) in prev_items.items():
+                if key not in self._items:
+                    dirty.append(rect)
+
+            dirty = [r.clip(screen_rect) for r in dirty]
+            dirty = [r for r in dirty if r.width > 0 and r.height > 0]
+            if any(r.contains(screen_rect) for r in dirty):
+                # 整屏变化（如背景模糊遮罩渐变），直接 flip
+                pygame.display.flip()
+                self.last_dirty_count = -1
+            else:
+                if dirty:
+                    pygame.display.update(dirty)
+                self.last_dirty_count = len(dirty)
+
+        self._prev_items = self._items
+        self._full_redraw = False
+
+class HudText:
+    """右上角的一条文本"""
+    __slots__ = ('text', 'color', 'version', 'surface')
+
+    def __init__(self, text: str, color: Tuple[int, int, int], version: int):
+        self.text = text  # 文本内容
+        self.color = color  # 文本颜色
+        self.version = version  # 内容变化时的版本号
+        self.surface: Optional[pygame.Surface] = None  # 渲染结果，内容变化后置空
+
+class HudTextStore:
+    """右上角文本存储
+
+    按 key 保存文本项，保持添加顺序。只有文本或颜色真正变化时才更新版本号，
+    渲染结果和排版（各行位置）只在版本号变化后重新计算。
+    """
+    def __init__(self):
+        self.entries: Dict[Any, HudText] = {}  # key -> 文本项，字典保持插入顺序
+        self.version = 0  # 任一文本项增删改时递增
+        self._layout_version = -1  # 当前排版对应的版本号
+        self._layout: List[Tuple[Any, HudText, pygame.Rect]] = []
+        self._layout_bottom = 0
+        self._anonymous = 0  # 未指定 key 的文本项计数
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def set(self, key: Any, text: str, color: Tuple[int, int, int]) -> None:
+        """设置文本项，内容不变时不做任何事"""
+        if key is None:
+            key = ('anonymous', self._anonymous)
+            self._anonymous += 1
+        entry = self.entries.get(key)
+        if entry is not None and entry.text == text and entry.color == color:
+            return
+        self.version += 1
+        if entry is None:
+            self.entries[key] = HudText(text, color, self.version)
+        else:
+            entry.text, entry.color, entry.version, entry.surface = text, color, self.version, None
+
+    def remove(self, key: Any) -> None:
+        """移除文本项"""
+        if self.entries.pop(key, None) is not None:
+            self.version += 1
+
+    def clear(self) -> None:
+        """清空所有文本项"""
+        if self.entries:
+            self.entries.clear()
+            self.version += 1
+
+    def layout(self, font: pygame.font.Font, top: int = 8) -> Tuple[List[Tuple[Any, HudText, pygame.Rect]], int]:
+        """返回 (key, 文本项, 位置) 列表和最后一行下方的 y 坐标，内容未变化时直接复用上次结果"""
+        if self._layout_version != self.version:
+            layout = []
+            y_offset = top
+            for key, entry in self.entries.items():
+                if entry.surface is None:
+                    entry.surface = font.render(entry.text, True, entry.color)
+                rect = entry.surface.get_rect(topright=(SCREEN_W - 8, y_offset))
+                layout.append((key, entry, rect))
+                y_offset += rect.height + 2  # 增加行间距
+            self._layout, self._layout_bottom = layout, y_offset
+            self._layout_version = self.version
+        return self._layout, self._layout_bottom
+
+class Notice:
+    """一条右上角通知：记录文本和时间参数，显示内容在绘制时按经过时间计算"""
+    __slots__ = ('text', 'color', 'start', 'reveal_ms', 'hold_ms', 'interval_ms', 'cancelled', 'surfaces')
+
+    def __init__(self, text: str, color: Tuple[int, int, int], start: float, reveal_ms: float, hold_ms: float):
+        self.text = text  # 完整文本
+        self.color = color  # 文本颜色
+        self.start = start  # 开始时间（毫秒）
+        self.reveal_ms = max(0.0, reveal_ms)  # 逐字显示完整文本所需的时间（毫秒），0 表示立即完整显示
+        self.hold_ms = hold_ms  # 完整显示后停留的时间（毫秒）
+        self.interval_ms = self.reveal_ms / len(text)  # 每个字符的显示/清除间隔（毫秒），清除速度与显示速度相同
+        self.cancelled = False  # 是否被取消
+        self.surfaces: Dict[int, pygame.Surface] = {}  # 已渲染的文本前缀：字符数 -> Surface
+
+    def cancel(self) -> None:
+        """取消通知，下一帧起不再显示"""
+        self.cancelled = True
+
+    def visible_chars(self, now: float) -> int:
+        """当前应显示的字符数，0 表示通知已结束"""
+        if self.cancelled:
+            return 0
+        total = len(self.text)
+        elapsed = now - self.start
+        if self.interval_ms <= 0:
+            # 不逐字显示：停留时间内完整显示，之后立即清除
+            return total if elapsed < self.hold_ms else 0
+        if elapsed < self.reveal_ms:
+            return min(total, int(elapsed // self.interval_ms) + 1)
+        elapsed -= self.reveal_ms + self.hold_ms
+        if elapsed < 0:
+            return total
+        return max(0, total - 1 - int(elapsed // self.interval_ms))
+
+    def surface(self, font: pygame.font.Font, count: int) -> pygame.Surface:
+        """返回前 count 个字符的渲染结果，每个前缀只渲染一次"""
+        surf = self.surfaces.get(count)
+        if surf is None:
+            surf = self.surfaces[count] = font.render(self.text[:count], True, self.color)
+        return surf
+
+class NoticeLayer:
+    """右上角通知层
+
+    每条通知只保存文本和开始时间等参数，绘制时由经过时间算出可见前缀，
+    不需要定时任务，也不需要逐帧修改右上角文本列表。按真实时间计时，暂停时照常播放。
+    """
+    def __init__(self, clock: Optional[Union[WallClock, LoopClock, SimulationClock]] = None):
+        self.clock = clock or WallClock()  # 计时所用的时钟
+        self.notices: List[Notice] = []  # 按添加顺序排列的通知
+
+    def set_clock(self, clock: Union[WallClock, LoopClock, SimulationClock]) -> None:
+        """更换时钟，正在显示的通知按新旧时钟的差值平移开始时间"""
+        shift = clock.now() - self.clock.now()
+        self.clock = clock
+        for notice in self.notices:
+            notice.start += shift
+
+    def add(self, text: str, reveal_ms: float, hold_ms: float = 5000,
+            color: Tuple[int, int, int] = COLOR_LIGHT_YELLOW) -> Optional[Notice]:
+        """添加一条通知，返回的对象可以通过 cancel() 提前清除；文本为空时不添加，返回 None"""
+        if not text:
+            return None
+        notice = Notice(text, color, self.clock.now(), reveal_ms, hold_ms)
+        self.notices.append(notice)
+        return notice
+
+    def clear(self) -> None:
+        """清除所有通知"""
+        self.notices.clear()
+
+    def draw(self, screen: pygame.Surface, font: pygame.font.Font, y_offset: int, renderer: DirtyRectTracker) -> int:
+        """从 y_offset 开始向下绘制所有通知，移除已结束的通知，返回绘制后的 y 坐标"""
+        now = self.clock.now()
+        alive = []
+        for notice in self.notices:
+            count = notice.visible_chars(now)
+            if count <= 0:
+                continue
+            alive.append(notice)
+            text_surf = notice.surface(font, count)
+            rect = text_surf.get_rect(topright=(SCREEN_W - 8, y_offset))
+            screen.blit(text_surf, rect)
+            renderer.track(('notice', id(notice)), rect, (count, y_offset))
+            y_offset += text_surf.get_height() + 2
+        if len(alive) != len(self.notices):
+            self.notices = alive
+        return y_offset
+
 class UIManager:
     """UI管理器类"""
     def __init__(self, game):
@@ -1348,7 +2843,9 @@ class UIManager:
         self.music_volume = 1.0
         self.master_volume = 1.0  # 新增主音量属性
         # 右上角文本管理系统
-        self.top_right_texts = []  # 存储右上角显示的文本项
+        self.top_right_texts = HudTextStore()  # 存储右上角显示的文本项
+        self._top_right_signature = None  # 生成右上角提示所依据的状态，变化时才重新生成
+        self.notice_layer = NoticeLayer()  # 右上角通知，显示在文本项下方
 
         self.modal_active = False
         self.modal_progress = 0.0
@@ -1399,6 +2896,11 @@ class UIManager:
         self.settings_active = False
         self.settings_progress = 0.0
         self.settings_fade_speed = 4.0
+        # 设置界面与模态弹窗的模糊背景快照，以及按完全不透明缓存的窗口表面
+        self._settings_backdrop = BlurredBackdrop(4)
+        self._settings_window_cache = None  # (内容签名, Surface)
+        self._modal_backdrop = BlurredBackdrop(8)
+        self._modal_popup_cache = None  # (弹窗类型和悬停状态, Surface)
         self.input_active = False
         self.active_key_binding = None
         # 关闭按钮位置
@@ -1461,7 +2963,9 @@ class UIManager:
             'show_stats': {'text': '打开统计', 'rect': pygame.Rect(50, 710, 120, 40)}
         }
 
-        self.title_logo = Utils.load_image('logo', (120, 120))
+        self.title_logo = global_asset_cache.get_image('logo', LOGO_SIZE)
+        # 标题按钮表面缓存：(按钮名, 悬停状态) -> Surface，过渡动画只修改透明度
+        self._title_button_cache = {}
     
     def add_top_right_text(self, text, color=COLOR_LIGHT_GRAY, key=None):
         """添加右上角文本
@@ -1471,27 +2975,22 @@ class UIManager:
             color: 文本颜色，默认为灰色
             key: 文本项的唯一标识符，用于后续更新或删除
         """
-
-        for i, item in enumerate(self.top_right_texts):
-            if 'key' in item and item['key'] == key:
-                self.top_right_texts[i] = {'text': text, 'color': color, 'key': key}
-                return
-        # 如果不存在相同key或没有指定key，则添加新文本项
-        self.top_right_texts.append({'text': text, 'color': color, 'key': key})
+        self.top_right_texts.set(key, text, color)
     
     def remove_top_right_text(self, key):
         """根据key移除右上角文本"""
-        self.top_right_texts = [item for item in self.top_right_texts if 'key' not in item or item['key'] != key]
+        self.top_right_texts.remove(key)
     
     def clear_top_right_texts(self):
         """清空所有右上角文本"""
-        self.top_right_texts = []
+        self.top_right_texts.clear()
+        self._top_right_signature = None
 
     def update_top_right_texts(self):
         """更新右上角文本内容（如BGM状态等）"""
 
         try:
-            status = 'BGM: ON' if pygame.mixer.music.get_busy() else 'BGM: OFF'
+            status = 'BGM: ON' if self.game.music_playing else 'BGM: OFF'
             # 使用自定义按键绑定显示提示
             music_key_text = self.key_bindings['music']['text']
             self.add_top_right_text(f'{status} (按 {music_key_text} 切换)', key='music_status')
@@ -1521,22 +3020,46 @@ class UIManager:
     def draw_hud(self, screen, score, player):
         """绘制游戏HUD界面"""
         # 绘制得分和生命值
+        renderer = self.game.renderer
         score_s = self.font.render(f'得分: {score}', True, COLOR_WHITE)
         health_s = self.font.render(f'生命值: {player.health}', True, COLOR_WHITE)
         screen.blit(score_s, (8, 8))
         screen.blit(health_s, (8, 36))
+        renderer.track('hud_score', score_s.get_rect(topleft=(8, 8)), score)
+        renderer.track('hud_health', health_s.get_rect(topleft=(8, 36)), player.health)
 
         # 绘制浮动文本效果
         for ft in self.game.floating_texts:
             ft.draw(screen, self.font)
-        self.update_top_right_texts()
-        
-        # 绘制所有右上角文本，从上到下排列
-        y_offset = 8  # 初始y坐标
-        for item in self.top_right_texts:
-            text_surf = self.font.render(item['text'], True, item['color'])
-            screen.blit(text_surf, (SCREEN_W - text_surf.get_width() - 8, y_offset))
-            y_offset += text_surf.get_height() + 2  # 增加行间距
+            if ft.alive:
+                renderer.track(('floating_text', id(ft)), (ft.x, ft.y) + self.font.size(ft.text), ft.alpha)
+        # 右上角提示只在音乐开关、按键绑定或阶段变化后重新生成
+        bindings = self.key_bindings
+        signature = (self.game.music_playing, bindings.get('music', {}).get('text'), bindings.get('show_stats', {}).get('text'),
+                     bindings.get('shoot_switch', {}).get('text'), self.game.stage >= 3)
+        if signature != self._top_right_signature:
+            self._top_right_signature = signature
+            self.update_top_right_texts()
+        
+        # 绘制所有右上角文本，从上到下排列，排版只在文本变化后重新计算
+        layout, y_offset = self.top_right_texts.layout(self.font)
+        for key, entry, rect in layout:
+            screen.blit(entry.surface, rect)
+            renderer.track(('top_right_text', key), rect, (rect.topleft, entry.version))
+        self.notice_layer.draw(screen, self.font, y_offset, renderer)
+    
+    def draw_profiler(self, screen, lines):
+        """在左下角绘制性能面板"""
+        line_h = self.font.get_linesize()
+        width = max(self.font.size(line)[0] for line in lines) + 12
+        height = line_h * len(lines) + 8
+        panel = pygame.Rect(4, SCREEN_H - height - 4, width, height)
+        overlay = pygame.Surface(panel.size, pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 170))
+        for i, line in enumerate(lines):
+            overlay.blit(self.font.render(line, True, COLOR_WHITE), (6, 4 + i * line_h))
+        screen.blit(overlay, panel.topleft)
+        self.game.renderer.track('profiler', panel, tuple(lines))
     
     def draw_title(self, screen, start_transition, transition_progress):
         """绘制标题界面"""
@@ -1547,39 +3070,76 @@ class UIManager:
 
         # 绘制 logo
         if self.title_logo:
-            if start_transition:
-                logo_copy = self.title_logo.copy()
-                logo_copy.set_alpha(alpha)
-                logo_x = SCREEN_W // 2 - 60
-                logo_y = 150
-                screen.blit(logo_copy, (logo_x, logo_y))
-            else:
-                logo_x = SCREEN_W // 2 - 60
-                logo_y = 150
-                screen.blit(self.title_logo, (logo_x, logo_y))
+            logo_x = SCREEN_W // 2 - 60
+            logo_y = 150
+            self.title_logo.set_alpha(alpha)
+            screen.blit(self.title_logo, (logo_x, logo_y))
+            self.game.renderer.track('title_logo', self.title_logo.get_rect(topleft=(logo_x, logo_y)), alpha)
 
         # 绘制按钮
-        for btn_info in self.title_buttons.values():
-            # 绘制按钮背景
-            color = btn_info['color']
-            if btn_info['hover']:
-                # 悬停时稍微变亮
-                color = tuple(min(255, c + 30) for c in color)
-
-            btn_surf = pygame.Surface((btn_info['rect'].width, btn_info['rect'].height), pygame.SRCALPHA)
-
-            # 在临时surface上绘制圆角矩形
-            pygame.draw.rect(btn_surf, color + (alpha,), btn_surf.get_rect(), border_radius=10)
-
-            # 按钮文字
-            text = self.large_font.render(btn_info['text'], True, COLOR_WHITE)
-            text_x = btn_info['rect'].width // 2 - text.get_width() // 2
-            text_y = btn_info['rect'].height // 2 - text.get_height() // 2
-            text.set_alpha(alpha)
-            btn_surf.blit(text, (text_x, text_y))
-
-            # 将带透明度的按钮绘制到屏幕
+        for btn_name, btn_info in self.title_buttons.items():
+            btn_surf = self._get_title_button_surface(btn_name, btn_info['hover'])
+            btn_surf.set_alpha(alpha)
             screen.blit(btn_surf, btn_info['rect'])
+            self.game.renderer.track(('title_button', btn_name), btn_info['rect'], (btn_info['hover'], alpha))
+    
+    def _get_title_button_surface(self, btn_name, hover):
+        """获取标题按钮的缓存表面，不存在时按完全不透明绘制一次"""
+        key = (btn_name, hover)
+        btn_surf = self._title_button_cache.get(key)
+        if btn_surf is not None:
+            return btn_surf
+
+        btn_info = self.title_buttons[btn_name]
+        # 绘制按钮背景
+        color = btn_info['color']
+        if hover:
+            # 悬停时稍微变亮
+            color = tuple(min(255, c + 30) for c in color)
+
+        btn_surf = pygame.Surface((btn_info['rect'].width, btn_info['rect'].height), pygame.SRCALPHA)
+
+        # 在临时surface上绘制圆角矩形
+        pygame.draw.rect(btn_surf, color, btn_surf.get_rect(), border_radius=10)
+
+        # 按钮文字
+        text = self.large_font.render(btn_info['text'], True, COLOR_WHITE)
+        text_x = btn_info['rect'].width // 2 - text.get_width() // 2
+        text_y = btn_info['rect'].height // 2 - text.get_height() // 2
+        btn_surf.blit(text, (text_x, text_y))
+
+        self._title_button_cache[key] = btn_surf
+        return btn_surf
+    
+    def invalidate_title_button(self, btn_name):
+        """使单个标题按钮的缓存失效（如修改了按钮文字或颜色）"""
+        self._title_button_cache.pop((btn_name, False), None)
+        self._title_button_cache.pop((btn_name, True), None)
+    
+    def apply_volume_settings(self, preview: Optional[Tuple[str, int]] = None):
+        """将音量设置应用到背景音乐和音效，音量变化时调用
+
+        Args:
+            preview: 可选的 (音量名称, 临时值)，数字输入过程中用于实时预览
+        """
+        values = {name: vol_info['value'] for name, vol_info in self.volume_settings.items()}
+        if preview is not None and preview[0] in values:
+            values[preview[0]] = preview[1]
+        master_val = values['master'] / 100
+        # 最终音量 = 主音量 x 音乐/音效音量
+        if pygame.mixer.get_init():
+            pygame.mixer.music.set_volume(master_val * values['music'] / 100)
+        global_audio_manager.set_volume(master_val * values['sound'] / 100)
+    
+    def update_title_hover(self, pos):
+        """根据鼠标位置更新标题按钮的悬停状态，鼠标进入按钮时播放悬停音效"""
+        for btn_info in self.title_buttons.values():
+            hover = btn_info['rect'].collidepoint(pos)
+            if hover and not btn_info['hover']:
+                Utils.play_sound(self.game.snd_ui_hover, self.game)
+            if hover != btn_info['hover']:
+                self.game.scene_version += 1
+            btn_info['hover'] = hover
     
     def draw_settings(self, screen):
         """绘制设置界面"""
@@ -1588,18 +3148,36 @@ class UIManager:
         settings_x = SCREEN_W // 2 - settings_w // 2
         settings_y = SCREEN_H // 2 - settings_h // 2
         p = max(0.0, min(1.0, self.settings_progress))
-        try:
-            snap = screen.copy()
-            small = pygame.transform.smoothscale(snap, (SCREEN_W // 4, SCREEN_H // 4))
-            blurred = pygame.transform.smoothscale(small, (SCREEN_W, SCREEN_H))
-            blurred.set_alpha(int(192 * p))
-            screen.blit(blurred, (0, 0))
-        except Exception:
-            # 如果模糊失败，使用半透明遮罩
-            overlay = pygame.Surface((SCREEN_W, SCREEN_H))
-            overlay.fill(COLOR_BLACK)
-            overlay.set_alpha(int(160 * p))
-            screen.blit(overlay, (0, 0))
+        self._settings_backdrop.draw(screen, int(192 * p), (self.game.state, self.game.paused, self.game.scene_version))
+        self.game.renderer.track('settings_backdrop', screen.get_rect(), p)
+
+        # 窗口内容按完全不透明缓存，只在内容变化时重绘，淡入淡出只调整透明度
+        signature = self._settings_signature()
+        if self._settings_window_cache is None or self._settings_window_cache[0] != signature:
+            window_surf = self._render_settings_window(settings_x, settings_y, settings_w, settings_h)
+            self._settings_window_cache = (signature, window_surf)
+        window_surf = self._settings_window_cache[1]
+        window_surf.set_alpha(int(255 * p))
+
+        screen.blit(window_surf, (settings_x, settings_y))
+        self.game.renderer.track('settings_window', window_surf.get_rect(topleft=(settings_x, settings_y)), (p, signature))
+
+        # 绘制数字输入界面
+        self._draw_number_input(screen, p)
+    
+    def _settings_signature(self):
+        """设置窗口的内容签名，用于判断窗口内容是否发生变化"""
+        return (
+            tuple(vol_info['value'] for vol_info in self.volume_settings.values()),
+            self.current_difficulty_index,
+            tuple((key_info['key'], key_info['text']) for key_info in self.key_bindings.values()),
+            self.input_active,
+            self.active_key_binding
+        )
+    
+    def _render_settings_window(self, settings_x, settings_y, settings_w, settings_h):
+        """按完全不透明绘制设置窗口"""
+        p = 1.0
         window_surf = pygame.Surface((settings_w, settings_h), pygame.SRCALPHA)
         window_color = (100, 150, 255, int(240 * p))
         pygame.draw.rect(window_surf, window_color, window_surf.get_rect(), border_radius=20)
@@ -1650,10 +3228,7 @@ class UIManager:
         # 绘制按键绑定按钮
         self._draw_key_bindings(window_surf, settings_x, settings_y, p)
 
-        screen.blit(window_surf, (settings_x, settings_y))
-
-        # 绘制数字输入界面
-        self._draw_number_input(screen, p)
+        return window_surf
     
     def _draw_volume_sliders(self, window_surf, settings_x, settings_y, p):
         """绘制音量滑块"""
@@ -1749,6 +3324,7 @@ class UIManager:
         overlay = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 128))
         screen.blit(overlay, (0, 0))
+        self.game.renderer.track('number_input_overlay', screen.get_rect())
 
         # 输入框背景
         input_surf = pygame.Surface((input_w, input_h), pygame.SRCALPHA)
@@ -1815,6 +3391,8 @@ class UIManager:
                                         cancel_btn.height)
 
         screen.blit(input_surf, (input_x, input_y))
+        self.game.renderer.track('number_input', input_surf.get_rect(topleft=(input_x, input_y)),
+                                 (self.active_volume, self.input_value, self.input_cursor_visible))
     
     def draw_modal(self, screen, dt):
         """绘制模态弹窗"""
@@ -1822,7 +3400,8 @@ class UIManager:
         self.modal_progress += dt * self.modal_fade_speed
         p = max(0.0, min(1.0, self.modal_progress))
 
-        Utils.draw_blurred_background(screen, int(200 * p))
+        self._modal_backdrop.draw(screen, int(200 * p), (self.game.state, self.game.paused, self.game.scene_version))
+        self.game.renderer.track('modal_backdrop', screen.get_rect(), p)
 
         # 弹窗尺寸
         pw = int(SCREEN_W * 0.78)
@@ -1830,9 +3409,29 @@ class UIManager:
         px = (SCREEN_W - pw) // 2
         py = int(SCREEN_H * 0.18)
 
+        hover_confirm, hover_continue = self._update_modal_hover(pw, ph)
+
+        # 弹窗按完全不透明缓存，只在类型或悬停状态变化时重绘，淡入淡出只调整透明度
+        cache_key = (self.modal_type, hover_confirm, hover_continue)
+        if self._modal_popup_cache is None or self._modal_popup_cache[0] != cache_key:
+            self._modal_popup_cache = (cache_key, self._render_modal_popup(pw, ph, hover_confirm, hover_continue))
+        popup_surf = self._modal_popup_cache[1]
+
+        # 保存关闭按钮位置信息（用于点击检测）
+        close_button_size = 30
+        self.close_button_rect = pygame.Rect(pw - close_button_size - 15, 15, close_button_size, close_button_size)
+
+        # 将 popup_surf 以 alpha 放到屏幕
+        popup_alpha = int(255 * p)
+        popup_surf.set_alpha(popup_alpha)
+        screen.blit(popup_surf, (px, py))
+        self.game.renderer.track('modal_popup', popup_surf.get_rect(topleft=(px, py)), (popup_alpha, cache_key))
+    
+    def _render_modal_popup(self, pw, ph, hover_confirm, hover_continue):
+        """按完全不透明绘制模态弹窗"""
         popup_surf = pygame.Surface((pw, ph), pygame.SRCALPHA)
         popup_color = COLOR_SKY_BLUE
-        popup_alpha = int(255 * p)
+        popup_alpha = 255
         popup_surf.fill((0, 0, 0, 0))
         pygame.draw.rect(popup_surf, popup_color + (popup_alpha,), (0, 0, pw, ph), border_radius=14)
 
@@ -1860,9 +3459,6 @@ class UIManager:
         close_button_x = pw - close_button_size - 15
         close_button_y = 15
         
-        # 保存关闭按钮位置信息（用于点击检测）
-        self.close_button_rect = pygame.Rect(close_button_x, close_button_y, close_button_size, close_button_size)
-        
         # 绘制关闭按钮背景
         pygame.draw.circle(popup_surf, (220, 50, 50, popup_alpha), 
                           (close_button_x + close_button_radius, close_button_y + close_button_radius), 
@@ -1876,35 +3472,52 @@ class UIManager:
         popup_surf.blit(close_text, (close_text_x, close_text_y))
 
         # 绘制按钮
-        self._draw_modal_buttons(popup_surf, pw, ph, confirm_label, popup_alpha)
-
-        # 将 popup_surf 以 alpha 放到屏幕
-        popup_surf.set_alpha(popup_alpha)
-        screen.blit(popup_surf, (px, py))
+        self._draw_modal_buttons(popup_surf, pw, ph, confirm_label, popup_alpha, hover_confirm, hover_continue)
+        return popup_surf
     
-    def _draw_modal_buttons(self, popup_surf, pw, ph, confirm_label, popup_alpha):
-        """绘制模态弹窗按钮"""
-        # 按钮布局
+    def _modal_button_rects(self, pw, ph):
+        """模态弹窗确认和继续按钮的矩形（弹窗坐标系）"""
         btn_w = int(pw * 0.42)
         btn_h = 44
-        btn_pad = 18
         btn_y = ph - btn_h - 18
         btn1_x = 20
         btn2_x = pw - btn_w - 20
-
+        return pygame.Rect(btn1_x, btn_y, btn_w, btn_h), pygame.Rect(btn2_x, btn_y, btn_w, btn_h)
+    
+    def _update_modal_hover(self, pw, ph):
+        """更新模态弹窗按钮的悬停状态，返回 (确认按钮悬停, 继续按钮悬停)"""
         mouse_x, mouse_y = pygame.mouse.get_pos()
         # 判断是否 hover（在 popup 坐标系）
         local_mx = mouse_x - (SCREEN_W - pw) // 2
         local_my = mouse_y - int(SCREEN_H * 0.18)
 
         # 确认和继续按钮矩形
-        rbtn_rect = pygame.Rect(btn1_x, btn_y, btn_w, btn_h)
-        cbtn_rect = pygame.Rect(btn2_x, btn_y, btn_w, btn_h)
+        rbtn_rect, cbtn_rect = self._modal_button_rects(pw, ph)
 
         # hover 状态
         hover_confirm = rbtn_rect.collidepoint(local_mx, local_my)
         hover_continue = cbtn_rect.collidepoint(local_mx, local_my)
 
+        # 鼠标 hover 音效触发一次
+        if hover_confirm and not self.modal_hover['confirm']:
+            Utils.play_sound(self.game.snd_ui_hover, self.game)
+        if hover_continue and not self.modal_hover['continue']:
+            Utils.play_sound(self.game.snd_ui_hover, self.game)
+
+        self.modal_hover['confirm'] = hover_confirm
+        self.modal_hover['continue'] = hover_continue
+
+        # 保存按钮 rects 以便事件处理（全局坐标）
+        px = (SCREEN_W - pw) // 2
+        py = int(SCREEN_H * 0.18)
+        self._popup_confirm_rect = pygame.Rect(px + rbtn_rect.x, py + rbtn_rect.y, rbtn_rect.w, rbtn_rect.h)
+        self._popup_continue_rect = pygame.Rect(px + cbtn_rect.x, py + cbtn_rect.y, cbtn_rect.w, cbtn_rect.h)
+        return hover_confirm, hover_continue
+    
+    def _draw_modal_buttons(self, popup_surf, pw, ph, confirm_label, popup_alpha, hover_confirm, hover_continue):
+        """绘制模态弹窗按钮"""
+        rbtn_rect, cbtn_rect = self._modal_button_rects(pw, ph)
+
         # 绘制按钮
         def draw_button(surf, rect, text, base_color, hovered):
             scale = 1.08 if hovered else 1.0
@@ -1920,21 +3533,6 @@ class UIManager:
 
         draw_button(popup_surf, rbtn_rect, confirm_label, COLOR_BUTTON_RED, hover_confirm)
         draw_button(popup_surf, cbtn_rect, '继续游玩', COLOR_BUTTON_GREEN, hover_continue)
-
-        # 鼠标 hover 音效触发一次
-        if hover_confirm and not self.modal_hover['confirm']:
-            Utils.play_sound(self.game.snd_ui_hover, self.game)
-        if hover_continue and not self.modal_hover['continue']:
-            Utils.play_sound(self.game.snd_ui_hover, self.game)
-
-        self.modal_hover['confirm'] = hover_confirm
-        self.modal_hover['continue'] = hover_continue
-
-        # 保存按钮 rects 以便事件处理（全局坐标）
-        px = (SCREEN_W - pw) // 2
-        py = int(SCREEN_H * 0.18)
-        self._popup_confirm_rect = pygame.Rect(px + rbtn_rect.x, py + rbtn_rect.y, rbtn_rect.w, rbtn_rect.h)
-        self._popup_continue_rect = pygame.Rect(px + cbtn_rect.x, py + cbtn_rect.y, cbtn_rect.w, cbtn_rect.h)
     
     def _check_key_duplicate(self, current_key_name):
         """检查按键是否有重复设置"""
@@ -1982,11 +3580,7 @@ class UIManager:
                     vol_info['value'] = max(0, min(100, new_value))
                     vol_info['dragging'] = True
 
-                    if vol_name == 'music' or vol_name == 'master':
-                        # 计算最终音乐音量 = 主音量 x 音乐音量
-                        master_val = self.volume_settings['master']['value'] / 100
-                        music_val = self.volume_settings['music']['value'] / 100
-                        pygame.mixer.music.set_volume(master_val * music_val)
+                    self.apply_volume_settings()
                     
                     return True
                 elif value_rect.collidepoint(pos):
@@ -2145,6 +3739,7 @@ class UIManager:
         
         # 将窗口绘制到屏幕上
         screen.blit(window_surf, (window_x, window_y))
+        self.game.renderer.track('statistics_window', window_surf.get_rect(topleft=(window_x, window_y)), tuple(stats_items))
     
     def draw_tutorial(self, screen):
         """绘制教程界面"""
@@ -2155,6 +3750,7 @@ class UIManager:
         overlay = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 150))
         screen.blit(overlay, (0, 0))
+        self.game.renderer.track('tutorial_overlay', screen.get_rect())
         
         # 窗口尺寸
         window_width = int(SCREEN_W * 0.85)
@@ -2259,6 +3855,7 @@ class UIManager:
         
         # 将窗口绘制到屏幕上
         screen.blit(window_surf, (window_x, window_y))
+        self.game.renderer.track('tutorial_window', window_surf.get_rect(topleft=(window_x, window_y)), tuple(controls))
 
     def show_error_popup(self, message):
         """显示错误提示弹窗
@@ -2353,9 +3950,16 @@ class UIManager:
 
         # 将弹窗绘制到屏幕
         screen.blit(popup_surf, (px, py))
+        self.game.renderer.track('error_popup', popup_surf.get_rect(topleft=(px, py)), self.error_popup_message)
     
     def update_animations(self, dt):
         """更新UI动画"""
+        # 遮罩关闭后丢弃模糊快照，下次打开时重新截取
+        if not self.settings_active:
+            self._settings_backdrop.reset()
+        if not self.modal_active:
+            self._modal_backdrop.reset()
+
         # 设置界面动画更新
         if self.settings_active:
             self.settings_progress += dt * self.settings_fade_speed
@@ -2425,7 +4029,7 @@ class CollisionManager:
 
                     ex = (b1.x + b1.w/2 + b2.x + b2.w/2) / 2
                     ey = (b1.y + b1.h/2 + b2.y + b2.h/2) / 2
-                    self.game.explosions.append(Explosion(ex, ey, duration=0.2, max_radius=12))
+                    self.game.add_explosion(Explosion(ex, ey, duration=0.2, max_radius=12))
                     
                     # 处理穿透子弹逻辑
                     # 非穿透子弹才标记为不活跃和移除
@@ -2479,7 +4083,7 @@ class CollisionManager:
                                           COLOR_RED,
                                           duration=1.5,
                                           rise_speed=60)
-                        self.game.floating_texts.append(ft)
+                        self.game.add_floating_text(ft)
                     
                     if self.game.player.health <= 0:
                         self.game.state = GAME_STATE_GAMEOVER
@@ -2525,7 +4129,7 @@ class CollisionManager:
                                                   COLOR_GOLD,
                                                   duration=1.5,
                                                   rise_speed=60)
-                                self.game.floating_texts.append(ft)
+                                self.game.add_floating_text(ft)
                         break
         
         # 移除击中敌人的子弹
@@ -2566,7 +4170,7 @@ class CollisionManager:
                                           COLOR_RED,
                                           duration=1.5,
                                           rise_speed=60)
-                        self.game.floating_texts.append(ft)
+                        self.game.add_floating_text(ft)
                     
                     if self.game.player.health <= 0:
                         self.game.state = GAME_STATE_GAMEOVER
@@ -2602,19 +4206,19 @@ class CollisionManager:
         # 在生命值右侧显示红色的伤害值
         health_text_width = self.game.ui_manager.font.size(f'生命值: {self.game.player.health}')[0]
         ft = FloatingText(8 + health_text_width + 4, 36, f'-{damage}', COLOR_DARK_RED)
-        self.game.floating_texts.append(ft)
+        self.game.add_floating_text(ft)
         
         # 在得分右侧显示分数减少
         score_text_width = self.game.ui_manager.font.size(f'得分: {self.game.score}')[0]
         ft = FloatingText(8 + score_text_width + 4, 8, f'-{score_penalty}', COLOR_DARK_RED)
-        self.game.floating_texts.append(ft)
+        self.game.add_floating_text(ft)
         
         # 玩家爆炸
         cx = self.game.player.x + self.game.player.w // 2
         cy = self.game.player.y + self.game.player.h // 2
         duration = 0.6 if crash else 0.5
         radius = 48 if crash else 40
-        self.game.explosions.append(Explosion(cx, cy, duration=duration, max_radius=radius))
+        self.game.add_explosion(Explosion(cx, cy, duration=duration, max_radius=radius))
         
         # 播放爆炸音效
         Utils.play_sound(self.game.snd_explode, self.game)
@@ -2627,13 +4231,13 @@ class CollisionManager:
         self.game.score += enemy.score
         score_text_width = self.game.ui_manager.font.size(f'得分: {self.game.score}')[0]
         ft = FloatingText(8 + score_text_width + 4, 8, f'+{enemy.score}', COLOR_LIGHT_GREEN)
-        self.game.floating_texts.append(ft)
+        self.game.add_floating_text(ft)
         
         # 增加玩家生命值100
         self.game.player.health = min(MAX_PLAYER_HEALTH, self.game.player.health + 100)
         health_text_width = self.game.ui_manager.font.size(f'生命值: {self.game.player.health}')[0]
         ft = FloatingText(8 + health_text_width + 4, 36, '+100', COLOR_LIGHT_GREEN)
-        self.game.floating_texts.append(ft)
+        self.game.add_floating_text(ft)
 
         # 无论玩家是否曾经受伤，只要当前处于无状态，都允许重新积累连续击杀
         self.game.player.consecutive_kills += 1
@@ -2645,7 +4249,7 @@ class CollisionManager:
         # 敌人爆炸
         cx = enemy.x + enemy.w // 2
         cy = enemy.y + enemy.h // 2
-        self.game.explosions.append(Explosion(cx, cy))
+        self.game.add_explosion(Explosion(cx, cy))
         
         # 播放爆炸音效
         Utils.play_sound(self.game.snd_explode, self.game)
@@ -2692,7 +4296,7 @@ class CollisionManager:
                                   COLOR_GREEN,
                                   duration=1.5,
                                   rise_speed=60)
-                self.game.floating_texts.append(ft)
+                self.game.add_floating_text(ft)
         
         # 移除被拾取的小道具
         self.game.powerups = [p for p in self.game.powerups if p not in powerups_to_remove]
@@ -2708,7 +4312,7 @@ class CollisionManager:
                 # 显示分数减少提示
                 score_text_width = self.game.ui_manager.font.size(f'得分: {self.game.score}')[0]
                 ft = FloatingText(8 + score_text_width + 4, 8, '-100', COLOR_DARK_RED)
-                self.game.floating_texts.append(ft)
+                self.game.add_floating_text(ft)
             if not e.alive:
                 enemies_to_remove.append(e)
         
@@ -2781,7 +4385,7 @@ class CollisionManager:
         def reset_tech_develop():
             self.game.tech_develop = False
         
-        runTaskLater(reset_tech_develop, 30000)
+        runTaskLater(reset_tech_develop, 30000, scheduler=self.game.session_scope)
     
     def _trigger_economy_develop(self):
         """触发经济发展事件"""
@@ -2795,22 +4399,21 @@ class CollisionManager:
         def reset_economy_develop():
             self.game.economy_develop = False
         
-        runTaskLater(reset_economy_develop, 30000)
+        runTaskLater(reset_economy_develop, 30000, scheduler=self.game.session_scope)
     
     def _trigger_hack_attack(self):
         """触发黑客入侵事件"""
-        # 显示notice
-        self.game.notice(3.0, "A市遭到黑客入侵，飞机指挥系统暂时瘫痪")
-        
-        # 设置标志
-        self.game.hack_attack = True
-        self.game.hack_attack_times += 1
-        
-        # 15秒后重置标志
-        def reset_hack_attack():
+        def hack_attack():
+            # 显示notice
+            self.game.notice(3.0, "A市遭到黑客入侵，飞机指挥系统暂时瘫痪")
+            
+            # 设置标志，15秒后重置
+            self.game.hack_attack = True
+            self.game.hack_attack_times += 1
+            yield wait(15000)
             self.game.hack_attack = False
         
-        runTaskLater(reset_hack_attack, 15000)
+        runCoroutine(hack_attack(), scheduler=self.game.session_scope)
     
     def _trigger_air_support(self):
         """触发空中支援事件"""
@@ -2827,7 +4430,7 @@ class CollisionManager:
         for enemy in self.game.enemies:
             # 创建爆炸效果
             ex, ey = enemy.x + enemy.w // 2, enemy.y + enemy.h // 2
-            self.game.explosions.append(Explosion(ex, ey, duration=0.6, max_radius=40))
+            self.game.add_explosion(Explosion(ex, ey, duration=0.6, max_radius=40))
             
             # 播放爆炸音效
             Utils.play_sound(self.game.snd_explode, self)
@@ -2843,7 +4446,7 @@ class CollisionManager:
         
         # 如果消灭了敌人，显示空中支援的文字提示
         if enemies_destroyed > 0:
-            self.game.floating_texts.append(FloatingText(
+            self.game.add_floating_text(FloatingText(
                 SCREEN_W // 2 - 100,
                 SCREEN_H // 4,
                 f'空中支援！消灭 {enemies_destroyed} 架敌机',
@@ -2876,22 +4479,40 @@ class CollisionManager:
         def reset_hurricane():
             self.game.hurricane_active = False
         
-        runTaskLater(reset_hurricane, 30000)
+        runTaskLater(reset_hurricane, 30000, scheduler=self.game.session_scope)
 class Game:
     """游戏主类"""
             
-    def __init__(self):
-        """初始化游戏主类"""
+    def __init__(self, dirty_rects: bool = False, debug: bool = False):
+        """初始化游戏主类
+        
+        Args:
+            dirty_rects: 是否启用脏矩形渲染模式，只提交每帧发生变化的屏幕区域
+            debug: 是否打印调试信息
+        """
         global global_debug
-        global_debug = False
+        global_debug = debug
         
-        self.screen: pygame.Surface = pygame.display.set_mode((SCREEN_W, SCREEN_H))
+        with global_startup_profiler.section('display.set_mode'):
+            self.screen: pygame.Surface = pygame.display.set_mode((SCREEN_W, SCREEN_H))
         pygame.display.set_caption('飞机大战 - balugaq')
         self.clock: pygame.time.Clock = pygame.time.Clock()
-
-        self._load_resources()
-
-        self.ui_manager: UIManager = UIManager(self)
+        self.renderer: DirtyRectTracker = DirtyRectTracker(enabled=dirty_rects)
+        # 画面版本号，下层画面变化时递增，遮罩据此判断模糊快照是否过期
+        self.scene_version: int = 0
+        # 性能面板（F3 切换）
+        self.profiler_active: bool = False
+        # 异步模式下的事件循环，设置后存档写入交给后台线程，不阻塞帧
+        self.io_loop: Optional[Any] = None
+        self._io_executor: Optional[ThreadPoolExecutor] = None
+        self._pending_io: Set[Any] = set()
+        self._first_frame: bool = True
+
+        with global_startup_profiler.section('_load_resources'):
+            self._load_resources()
+
+        with global_startup_profiler.section('UIManager.__init__'):
+            self.ui_manager: UIManager = UIManager(self)
         self.collision_manager: CollisionManager = CollisionManager(self)
         
         # 窗口焦点控制
@@ -2906,9 +4527,6 @@ class Game:
         self.r_cooldown: int = 1
         self.last_r_restart: float = 0.0
         
-        # 背景滚动控制
-        self.bg_scroll: float = 0.0  # 背景滚动偏移量（像素）
-        self.bg_scroll_speed: float = 5.0  # 每秒向下滚动的像素数
         
         # 数据存储路径
         self.data_dir: str = os.path.join('plane_war_data')
@@ -2917,9 +4535,11 @@ class Game:
         
         self.bullets_piercing: bool = False
 
-        self._load_settings()
+        with global_startup_profiler.section('_load_settings'):
+            self._load_settings()
 
-        self._init_statistics()
+        with global_startup_profiler.section('_init_statistics'):
+            self._init_statistics()
 
         self.allow_switch_shoot_type: bool = True
         
@@ -2996,7 +4616,7 @@ class Game:
                 if 'master' in self.ui_manager.volume_settings:
                     self.ui_manager.volume_settings['master']['value'] = int(self.ui_manager.master_volume * 100)
 
-            pygame.mixer.music.set_volume(self.ui_manager.master_volume * self.ui_manager.music_volume)
+            self.ui_manager.apply_volume_settings()
             
             # 加载按键绑定设置
             if 'key_bindings' in settings:
@@ -3093,7 +4713,7 @@ class Game:
         if key_bindings_data:
             settings['key_bindings'] = key_bindings_data
         
-        Utils.save_data(settings, self.settings_file)
+        self._write_data(settings, self.settings_file)
     
     def handle_corrupted_file(self, file_path, file_type):
         """处理损坏的JSON文件：尝试删除并重新生成"""
@@ -3146,7 +4766,8 @@ class Game:
         """保存游戏统计数据"""
         Utils.debug(f"尝试保存统计数据到文件: {self.stats_file}")
         try:
-            Utils.save_data(self.statistics, self.stats_file)
+            # 写入可能在后台线程进行，传入副本避免写入过程中统计被修改
+            self._write_data(dict(self.statistics), self.stats_file)
             Utils.debug("统计数据保存成功")
         except Exception as e:
             Utils.debug(f"统计数据保存失败: {e}")
@@ -3194,42 +4815,42 @@ class Game:
     
     def _load_resources(self):
         """加载游戏资源"""
-        # 图片资源
-        self.bg_img = Utils.load_image('background', BG_SIZE)
-        self.player_img = Utils.load_image('player', PLAYER_SIZE)
-        # 加载四个阶段的敌人图像
-        self.enemy_img1 = Utils.load_image('enemy1', ENEMY_SIZE)
-        self.enemy_img2 = Utils.load_image('enemy2', ENEMY_SIZE)
-        self.enemy_img3 = Utils.load_image('enemy3', ENEMY_SIZE)
-        self.enemy_img4 = Utils.load_image('enemy4', ENEMY_SIZE)
-        self.bullet_img = Utils.load_image('bullet', BULLET_SIZE)
-        
-        # 加载小道具图片
-        self.powerup_speed_img = Utils.load_image('speed', (64, 64))
-        self.powerup_shield_img = Utils.load_image('shield', (64, 64))
-        self.powerup_heal_img = Utils.load_image('heal', (64, 64))
-        self.powerup_super_rapid_shoot_img = Utils.load_image('super_rapid_shoot', (64, 64))
-        self.powerup_super_scatter_shoot_img = Utils.load_image('super_scatter_shoot', (64, 64))
-
-        # 音效资源
-        try:
-            pygame.mixer.init()
-        except Exception:
-            pass
-        
-        self.snd_player_shoot = Utils.load_sound('player_shoot')
-        self.snd_enemy_shoot = Utils.load_sound('enemy_shoot')
-        self.snd_explode = Utils.load_sound(SOUND_EXPLODE)
-        self.snd_popup = Utils.load_sound('popup')
-        self.snd_ui_hover = Utils.load_sound('hover')
-        self.snd_ui_click = Utils.load_sound('click')
-        self.snd_fail = Utils.load_sound(SOUND_FAIL)
-        self.snd_powerup = Utils.load_sound(SOUND_POWERUP)
-        self.snd_shield_hit = Utils.load_sound('shield_hit')
-        self.snd_shield_fail = Utils.load_sound('shield_fail')
+        # 优先使用预烘焙资源包，不存在或已过期时回退到原始 PNG/WAV
+        if global_asset_cache.pack is None:
+            global_asset_cache.pack = AssetPack.open()
+
+        # 关键资源：标题界面需要的背景与界面音效，首帧之前同步加载
+        self.bg_img = global_asset_cache.get_image('background', BG_SIZE)
+        self.background: BackgroundLayer = BackgroundLayer(self.bg_img)
+
+        # 音效资源（混音器只在 AudioManager 中初始化一次）
+        global_audio_manager.init()
+
+        self.snd_ui_hover = global_asset_cache.get_sound(SOUND_HOVER)
+        self.snd_ui_click = global_asset_cache.get_sound(SOUND_CLICK)
+        global_audio_manager.register(SOUND_HOVER, self.snd_ui_hover)
+        global_audio_manager.register(SOUND_CLICK, self.snd_ui_click)
+
+        # 其余资源（精灵、道具、游戏音效）在后台线程加载，就绪前为 None
+        self.player_img = None
+        self.enemy_img1 = self.enemy_img2 = self.enemy_img3 = self.enemy_img4 = None
+        self.bullet_img = None
+        self.powerup_speed_img = None
+        self.powerup_shield_img = None
+        self.powerup_heal_img = None
+        self.powerup_super_rapid_shoot_img = None
+        self.powerup_super_scatter_shoot_img = None
+        self.snd_player_shoot = self.snd_enemy_shoot = self.snd_explode = None
+        self.snd_popup = self.snd_fail = self.snd_powerup = None
+        self.snd_shield_hit = self.snd_shield_fail = None
+        deferred_sounds = ['player_shoot', 'enemy_shoot', SOUND_EXPLODE, 'popup', SOUND_FAIL,
+                           SOUND_POWERUP, 'shield_hit', 'shield_fail']
+        self.asset_loader: AssetLoader = AssetLoader(global_asset_cache)
+        self.asset_loader.start(DEFERRED_IMAGES, deferred_sounds, self._on_assets_ready)
 
         self.music_volume = 0.5
         self.music_loaded = False
+        self.music_playing = False  # 背景音乐是否在播放，只在播放和切换时更新
         try:
             music_path_ogg = os.path.join(ASSETS_MUSIC, 'bgm.ogg')
             music_path = None
@@ -3244,14 +4865,57 @@ class Game:
                     # 循环播放，淡入 1 秒
                     pygame.mixer.music.play(-1, 0.0, 1000)
                     self.music_loaded = True
+                    self.music_playing = True
                 except Exception:
                     self.music_loaded = False
         except Exception:
             self.music_loaded = False
     
+    def _on_assets_ready(self):
+        """后台资源就绪后（主线程）打包纹理图集并取出游戏用到的资源"""
+        # 精灵打包进同一张纹理图集，后续取到的都是图集中的子表面
+        if global_asset_cache.atlas is None:
+            global_asset_cache.build_atlas(ATLAS_SPRITES)
+
+        self.player_img = global_asset_cache.get_image('player', PLAYER_SIZE)
+        # 加载四个阶段的敌人图像
+        self.enemy_img1 = global_asset_cache.get_image('enemy1', ENEMY_SIZE)
+        self.enemy_img2 = global_asset_cache.get_image('enemy2', ENEMY_SIZE)
+        self.enemy_img3 = global_asset_cache.get_image('enemy3', ENEMY_SIZE)
+        self.enemy_img4 = global_asset_cache.get_image('enemy4', ENEMY_SIZE)
+        self.bullet_img = global_asset_cache.get_image('bullet', BULLET_SIZE)
+        
+        # 加载小道具图片
+        self.powerup_speed_img = global_asset_cache.get_image('speed', POWERUP_SIZE)
+        self.powerup_shield_img = global_asset_cache.get_image('shield', POWERUP_SIZE)
+        self.powerup_heal_img = global_asset_cache.get_image('heal', POWERUP_SIZE)
+        self.powerup_super_rapid_shoot_img = global_asset_cache.get_image('super_rapid_shoot', POWERUP_SIZE)
+        self.powerup_super_scatter_shoot_img = global_asset_cache.get_image('super_scatter_shoot', POWERUP_SIZE)
+
+        self.snd_player_shoot = global_asset_cache.get_sound('player_shoot')
+        self.snd_enemy_shoot = global_asset_cache.get_sound('enemy_shoot')
+        self.snd_explode = global_asset_cache.get_sound(SOUND_EXPLODE)
+        self.snd_popup = global_asset_cache.get_sound('popup')
+        self.snd_fail = global_asset_cache.get_sound(SOUND_FAIL)
+        self.snd_powerup = global_asset_cache.get_sound(SOUND_POWERUP)
+        self.snd_shield_hit = global_asset_cache.get_sound('shield_hit')
+        self.snd_shield_fail = global_asset_cache.get_sound('shield_fail')
+        for name, sound in (('player_shoot', self.snd_player_shoot), ('enemy_shoot', self.snd_enemy_shoot),
+                            (SOUND_EXPLODE, self.snd_explode), ('popup', self.snd_popup), (SOUND_FAIL, self.snd_fail),
+                            (SOUND_POWERUP, self.snd_powerup), ('shield_hit', self.snd_shield_hit),
+                            ('shield_fail', self.snd_shield_fail)):
+            global_audio_manager.register(name, sound)
+
+        # 标题 logo 与玩家在资源就绪前已创建，换成图集中的图片
+        if self.ui_manager is not None:
+            self.ui_manager.title_logo = global_asset_cache.get_image('logo', LOGO_SIZE)
+        if self.player is not None and self.player.img is None:
+            self.player.img = self.player_img
+    
     def reset(self) -> None:
         """重置游戏状态"""
         self.update_statistics()
+        self.scene_version += 1
         
         # 清除所有未处理的事件，避免长按按键的事件在新游戏中被处理
         pygame.event.clear()
@@ -3260,6 +4924,17 @@ class Game:
         if hasattr(self, 'rapid_shot_counter_task') and self.rapid_shot_counter_task:  # 保留此检查，因为任务可能不存在
             self.rapid_shot_counter_task.cancel()
             self.rapid_shot_counter_task: Optional[Task] = None
+        
+        # 丢弃上一局的全部游戏定时任务（道具恢复、随机事件等），新建作用域即关闭旧作用域
+        self.session_scope: TaskScope = global_task_scheduler.new_scope('session')
+        # 这些标志原本由上一局的定时任务恢复，任务丢弃后在这里直接复位
+        self.tech_develop = False
+        self.economy_develop = False
+        self.hack_attack = False
+        self.hurricane_active = False
+        # 超级连射、超级散射道具的恢复任务同样随作用域丢弃
+        self.allow_switch_shoot_type = True
+        self.bullets_piercing = False
 
         self.player: Player = Player(SCREEN_W // 2 - 18, SCREEN_H - 150, self.player_img)
 
@@ -3405,15 +5080,15 @@ class Game:
         powerup_type = random.choice(powerup_types)
 
         if powerup_type == 'speed':
-            powerup = SpeedPowerUp(x, y)
+            powerup = SpeedPowerUp(x, y, self.powerup_speed_img)
         elif powerup_type == 'shield':
-            powerup = ShieldPowerUp(x, y)
+            powerup = ShieldPowerUp(x, y, self.powerup_shield_img)
         elif powerup_type == 'heal':
-            powerup = HealPowerUp(x, y)
+            powerup = HealPowerUp(x, y, self.powerup_heal_img)
         elif powerup_type == 'super_rapid_shoot':
-            powerup = SuperRapidShootPowerUp(x, y)
+            powerup = SuperRapidShootPowerUp(x, y, self.powerup_super_rapid_shoot_img)
         elif powerup_type == 'super_scatter_shoot':
-            powerup = SuperScatterShootPowerUp(x, y)
+            powerup = SuperScatterShootPowerUp(x, y, self.powerup_super_scatter_shoot_img)
         
         # 添加到小道具列表
         self.powerups.append(powerup)
@@ -3607,6 +5282,10 @@ class Game:
     
     def update(self, dt: float) -> None:
         """更新游戏逻辑"""
+        self.scene_version += 1
+        # 游戏时间只在这里推进，暂停和弹窗期间的定时器随之冻结
+        global_sim_clock.advance(dt * 1000)
+        global_task_scheduler.update()
         for ex in self.explosions:
             ex.update(dt)
 
@@ -3744,37 +5423,71 @@ class Game:
 
     def draw(self):
         """绘制游戏画面"""
+        self.renderer.begin_frame()
+        if show_detail:
+            # 详细信息文字不参与跟踪，直接整屏刷新
+            self.renderer.invalidate_all()
+
         if self.state == GAME_STATE_TITLE or self.ui_manager.stats_active:
             self._draw_title_screen()
             return
 
+        track = self.renderer.track
+
         # 绘制背景
         self._draw_background()
 
-        # 绘制游戏对象
+        # 按图层收集 (surface, 位置) 序列，每个图层只调用一次 Surface.blits
+        # 图层顺序：敌人 -> 小道具/随机事件 -> 子弹 -> 玩家 -> 护盾 -> 爆炸 -> HUD
+        self.screen.blits([e.blit_item() for e in self.enemies], doreturn=False)
         for e in self.enemies:
-            e.draw(self.screen)
+            track(('enemy', e.object_id), (e.x, e.y, e.w, e.h))
         
-        # 绘制小道具（在敌人下方，在子弹下方，在玩家下方）
+        # 小道具（在敌人上方，在子弹下方，在玩家下方），随机事件与小道具同层级
+        item_layer = []
         for powerup in self.powerups:
-            powerup.draw(self.screen)
-        
-        # 绘制随机事件（与小道具同层级）
+            item_layer.extend(powerup.blit_items())
+            track(('powerup', powerup.object_id), (powerup.x, powerup.y, powerup.w, powerup.h),
+                  (powerup.show_effect, powerup.effect_progress))
         for event in self.random_events:
-            event.draw(self.screen)
+            item_layer.extend(event.blit_items())
+            # 脉冲光环最大半径为48，超出图标范围
+            track(('random_event', event.object_id), pygame.Rect(event.x, event.y, event.w, event.h).inflate(32, 32),
+                  (event.show_effect, event.effect_progress))
+        self.screen.blits(item_layer, doreturn=False)
 
+        if show_detail:
+            # 详细信息需要逐个绘制文字
+            for b in self.bullets:
+                b.draw(self.screen)
+        else:
+            bullet_layer = []
+            for b in self.bullets:
+                item = b.blit_item()
+                if item:
+                    bullet_layer.append(item)
+                else:
+                    # 没有图片的子弹以矩形绘制
+                    b.draw(self.screen)
+            self.screen.blits(bullet_layer, doreturn=False)
         for b in self.bullets:
-            b.draw(self.screen)
+            # 旋转后的子弹可能超出原始矩形
+            track(('bullet', b.object_id), pygame.Rect(b.x, b.y, b.w, b.h).inflate(b.h, b.h))
 
         self.player.draw(self.screen)
+        track('player', (self.player.x, self.player.y, self.player.w, self.player.h))
         
         # 绘制玩家护盾（如果存在且激活）
         if self.player.shield and self.player.shield and self.player.shield.active:
-            self.player.shield.draw(self.screen)
+            shield = self.player.shield
+            shield.draw(self.screen)
+            track('shield', (shield.x - shield.radius, shield.y - shield.radius, shield.radius * 2, shield.radius * 2),
+                  shield.shield_value)
 
         # 绘制爆炸特效（覆盖在实体之上）
+        Explosion.draw_all(self.screen, self.explosions)
         for ex in self.explosions:
-            ex.draw(self.screen)
+            track(('explosion', id(ex)), ex.bounding_rect(), ex.frame_index())
 
         # 绘制HUD
         self.ui_manager.draw_hud(self.screen, self.score, self.player)
@@ -3794,36 +5507,51 @@ class Game:
         if self.state == GAME_STATE_GAMEOVER:
             # 清除所有notice
             if self.ui_manager:
-                self.ui_manager.clear_top_right_text()
+                self.ui_manager.notice_layer.clear()
             self._draw_gameover_screen()
 
-        pygame.display.flip()
+        self._draw_profiler()
+        self.renderer.present()
+    
+    def _profiler_lines(self) -> List[str]:
+        """性能面板显示的内容"""
+        lines = ([f"FPS: {self.clock.get_fps():.1f}"] + global_quality_governor.profile_lines()
+                 + global_audio_manager.profile_lines())
+        lines += global_task_scheduler.stats_lines('游戏') + global_ui_scheduler.stats_lines('界面')
+        if global_debug:
+            lines += global_task_scheduler.profile_lines('游戏')
+        return lines
+    
+    def add_floating_text(self, ft: FloatingText) -> None:
+        """添加浮动文字，画质降级时按每秒上限丢弃多余的"""
+        if global_quality_governor.allow_floating_text():
+            self.floating_texts.append(ft)
+    
+    def add_explosion(self, explosion: Explosion) -> None:
+        """添加爆炸，画质降级时与仍在扩张的重叠爆炸合并（不再新增）"""
+        if global_quality_governor.reduces(QUALITY_MERGE_EXPLOSIONS):
+            for other in self.explosions:
+                if other.alive and other.time < other.duration / 2 and \
+                        math.hypot(other.x - explosion.x, other.y - explosion.y) < max(other.max_radius, explosion.max_radius):
+                    return
+        self.explosions.append(explosion)
+    
+    def _draw_profiler(self):
+        """绘制性能面板（F3 切换）"""
+        if self.profiler_active:
+            self.ui_manager.draw_profiler(self.screen, self._profiler_lines())
     
     def _draw_background(self):
-        """绘制背景"""
-
-        self.bg_scroll += self.bg_scroll_speed
-        if self.bg_scroll >= SCREEN_H:
-            self.bg_scroll = 0
-
-        # 背景图或纯色
-        if self.bg_img:
-            # 绘制两张背景图实现无缝滚动
-            y1 = int(self.bg_scroll - SCREEN_H)
-            y2 = int(self.bg_scroll)
-            self.screen.blit(self.bg_img, (0, y1))
-            self.screen.blit(self.bg_img, (0, y2))
-        else:
-            self.screen.fill(COLOR_NAVY_BLUE)
+        """绘制背景（滚动在 run 中按模拟时间推进）"""
+        self.renderer.track('background', self.screen.get_rect(), ('scroll', self.background.scroll_key()))
+        self.background.draw(self.screen)
     
     def _draw_title_screen(self):
         """绘制标题界面"""
         Utils.debug(f"绘制标题界面 - settings_active={self.ui_manager.settings_active}, stats_active={self.ui_manager.stats_active}")
-        # 绘制背景
-        if self.bg_img:
-            self.screen.blit(self.bg_img, (0, 0))
-        else:
-            self.screen.fill((16, 16, 32))
+        # 绘制背景（标题界面背景静止）
+        self.background.draw(self.screen, 0)
+        self.renderer.track('background', self.screen.get_rect(), 'title')
         
         # 绘制标题
         self.ui_manager.draw_title(self.screen, self.start_transition, self.transition_progress)
@@ -3848,7 +5576,8 @@ class Game:
         if self.ui_manager.modal_active:
             self.ui_manager.draw_modal(self.screen, 0.016)  # 使用固定的dt值进行绘制
         
-        pygame.display.flip()
+        self._draw_profiler()
+        self.renderer.present()
     
     def _draw_pause_screen(self):
         """绘制暂停界面"""
@@ -3859,6 +5588,8 @@ class Game:
             py = SCREEN_H // 2 - pause_text.get_height()
             self.screen.blit(pause_text, (px, py))
             self.screen.blit(pause_hint, (SCREEN_W // 2 - pause_hint.get_width() // 2, py + 40))
+            self.renderer.track('pause_text', pause_text.get_rect(topleft=(px, py)))
+            self.renderer.track('pause_hint', pause_hint.get_rect(topleft=(SCREEN_W // 2 - pause_hint.get_width() // 2, py + 40)))
     
     def _draw_gameover_screen(self):
         """绘制游戏结束界面"""
@@ -3866,6 +5597,8 @@ class Game:
         sub_s = self.ui_manager.font.render('按 R 重玩，Esc 退出', True, COLOR_GRAY)
         self.screen.blit(over_s, (SCREEN_W // 2 - over_s.get_width() // 2, SCREEN_H // 2 - 40))
         self.screen.blit(sub_s, (SCREEN_W // 2 - sub_s.get_width() // 2, SCREEN_H // 2 + 8))
+        self.renderer.track('gameover_title', over_s.get_rect(topleft=(SCREEN_W // 2 - over_s.get_width() // 2, SCREEN_H // 2 - 40)))
+        self.renderer.track('gameover_hint', sub_s.get_rect(topleft=(SCREEN_W // 2 - sub_s.get_width() // 2, SCREEN_H // 2 + 8)))
     
     def run(self):
         """游戏主循环"""
@@ -3876,60 +5609,150 @@ class Game:
             
             while running:
                 dt = self.clock.tick(FPS) / 1000.0
+                # 上一帧的实际耗时（不含等待），用于画质调节
+                global_quality_governor.sample(self.clock.get_rawtime())
+                running = self._frame(dt)
+            
+            self._shutdown()
+        except Exception as e:
+            self._report_crash(e)
+    
+    async def run_async(self):
+        """在 asyncio 事件循环中运行的游戏主循环（--asyncio）
+
+        帧间用 asyncio.sleep 让出事件循环，存档写入在后台线程完成，不阻塞帧。
+        界面定时器和通知改用事件循环的时钟，与帧节奏共用同一时间源。
+        """
+        import asyncio  # 仅异步模式需要，延迟导入以缩短启动时间
+        Utils.debug("进入异步游戏主循环")
+        try:
+            loop = asyncio.get_running_loop()
+            self.io_loop = loop
+            loop_clock = LoopClock(loop)
+            global_ui_scheduler.set_clock(loop_clock)
+            self.ui_manager.notice_layer.set_clock(loop_clock)
+            
+            running = True
+            frame_time = 1.0 / FPS
+            last_time = next_frame = loop.time()
+            while running:
+                now = loop.time()
+                dt, last_time = now - last_time, now
+                self.clock.tick()  # 只用于统计 FPS，节奏由下面的 asyncio.sleep 控制
+                start = perf_counter()
+                running = self._frame(dt)
+                global_quality_governor.sample((perf_counter() - start) * 1000)
                 
-                # 处理事件
-                running = self._handle_events(dt)
-
-                self.ui_manager.update_animations(dt)
-
-                if self.ui_manager.modal_active:
-                    self.ui_manager.modal_progress += dt * self.ui_manager.modal_fade_speed
-                    if self.ui_manager.modal_progress > 1.0:
-                        self.ui_manager.modal_progress = 1.0
-                elif self.ui_manager.modal_progress > 0:
-                    self.ui_manager.modal_progress -= dt * self.ui_manager.modal_fade_speed
-                    if self.ui_manager.modal_progress < 0:
-                        self.ui_manager.modal_progress = 0
-                
-                # 开始游戏过渡动画
-                if self.start_transition:
-                    self.transition_progress += dt * self.transition_speed
-                    if self.transition_progress >= 1.0:
-                        # 过渡完成，开始游戏
-                        self.start_transition = False
-                        self.transition_progress = 0.0
-                        self.state = GAME_STATE_PLAYING
-                        # 记录进入游戏状态的时间
-                        self.state_enter_time = time()
-                        
-                        self.notice(3.0, "欢迎开始游戏！", "祝你好运！")
-                        
-                        def reset_rapid_shot_counter():
-                            self.player.rapid_shot_counter = 0
+                next_frame += frame_time
+                delay = next_frame - loop.time()
+                if delay < 0:
+                    # 落后超过一帧时不追帧，从当前时间重新计时
+                    next_frame = loop.time()
+                    delay = 0
+                await asyncio.sleep(delay)
+            
+            # 等待尚未完成的写入，退出时的保存直接在主线程完成
+            if self._pending_io:
+                await asyncio.gather(*self._pending_io, return_exceptions=True)
+            self.io_loop = None
+            self._shutdown()
+        except Exception as e:
+            self._report_crash(e)
+        finally:
+            if self._io_executor is not None:
+                self._io_executor.shutdown(wait=True)
+    
+    def _frame(self, dt: float) -> bool:
+        """处理一帧：事件、动画、逻辑更新和绘制，返回是否继续运行"""
+        # 处理事件
+        running = self._handle_events(dt)
 
-                        self.rapid_shot_counter_task = runTaskTimer(reset_rapid_shot_counter, 0, 1000)
+        self.ui_manager.update_animations(dt)
 
-                global_task_scheduler.update()
+        if self.ui_manager.modal_active:
+            self.ui_manager.modal_progress += dt * self.ui_manager.modal_fade_speed
+            if self.ui_manager.modal_progress > 1.0:
+                self.ui_manager.modal_progress = 1.0
+        elif self.ui_manager.modal_progress > 0:
+            self.ui_manager.modal_progress -= dt * self.ui_manager.modal_fade_speed
+            if self.ui_manager.modal_progress < 0:
+                self.ui_manager.modal_progress = 0
+        
+        # 开始游戏过渡动画
+        if self.start_transition:
+            self.transition_progress += dt * self.transition_speed
+            self.scene_version += 1
+            if self.transition_progress >= 1.0:
+                # 过渡完成，开始游戏
+                self.start_transition = False
+                self.transition_progress = 0.0
+                self.state = GAME_STATE_PLAYING
+                # 记录进入游戏状态的时间
+                self.state_enter_time = time()
+                
+                self.notice(3.0, "欢迎开始游戏！", "祝你好运！")
                 
-                # 清理不再活跃的浮动文字
-                self.floating_texts = [ft for ft in self.floating_texts if ft.alive]
+                def reset_rapid_shot_counter():
+                    self.player.rapid_shot_counter = 0
 
-                if not self.ui_manager.modal_active and not self.paused:
-                    if self.state == GAME_STATE_PLAYING:
-                        self.update(dt)
+                self.rapid_shot_counter_task = runTaskTimer(reset_rapid_shot_counter, 0, 1000, scheduler=self.session_scope)
 
-                # 绘制游戏
-                self.draw()
-            
-            # 游戏退出时保存统计数据
-            Utils.debug("游戏即将退出，保存统计数据...")
-            self.update_statistics()
-            pygame.quit()
-        except Exception as e:
-            Utils.error(f"游戏运行出错: {e}")
-            Utils.error("错误详情:")
-            print_exc()
-            input("按Enter键退出...")
+        # 界面定时器按真实时间运行；游戏定时器在 Game.update 中随游戏时间推进
+        global_ui_scheduler.update()
+        
+        # 清理不再活跃的浮动文字
+        self.floating_texts = [ft for ft in self.floating_texts if ft.alive]
+
+        if not self.ui_manager.modal_active and not self.paused:
+            if self.state == GAME_STATE_PLAYING:
+                self.update(dt)
+            # 暂停或弹窗时背景静止，画面不变的帧几乎不需要提交
+            if self.state != GAME_STATE_TITLE:
+                self.background.update(dt)
+                self.scene_version += 1
+
+        # 后台资源加载完成后在主线程收尾，启动分析表在首帧和后台加载都完成后输出
+        if self.asset_loader.poll() and not self._first_frame:
+            global_startup_profiler.report()
+
+        # 绘制游戏
+        self.draw()
+        if self._first_frame:
+            self._first_frame = False
+            global_startup_profiler.mark('首次 display.flip（首帧）')
+            Utils.debug(f"首帧耗时: {(perf_counter() - STARTUP_TIME) * 1000:.1f} ms")
+        return running
+    
+    def _shutdown(self):
+        """退出主循环后导出诊断信息、保存统计数据并关闭 pygame"""
+        if '--scheduler-csv' in sys.argv:
+            TaskScheduler.export_csv(Utils.cli_str('--scheduler-csv', 'scheduler_stats.csv'),
+                                     {'game': global_task_scheduler, 'ui': global_ui_scheduler})
+        Utils.debug(global_asset_cache.report())
+        Utils.debug(global_audio_manager.report())
+        Utils.debug("游戏即将退出，保存统计数据...")
+        self.update_statistics()
+        pygame.quit()
+    
+    @staticmethod
+    def _report_crash(e):
+        """主循环出错时输出错误详情并等待确认"""
+        Utils.error(f"游戏运行出错: {e}")
+        Utils.error("错误详情:")
+        from traceback import print_exc  # 仅出错时需要，延迟导入
+        print_exc()
+        input("按Enter键退出...")
+    
+    def _write_data(self, data, file_path):
+        """保存数据到文件；异步模式下交给后台线程按提交顺序写入，不阻塞当前帧"""
+        if self.io_loop is None:
+            return Utils.save_data(data, file_path)
+        if self._io_executor is None:
+            self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='io')
+        future = self.io_loop.run_in_executor(self._io_executor, Utils.save_data, data, file_path)
+        self._pending_io.add(future)
+        future.add_done_callback(self._pending_io.discard)
+        return True
     
     def _handle_events(self, dt):
         """处理游戏事件"""
@@ -3960,6 +5783,10 @@ class Game:
             
             # 鼠标移动处理（用于音量滑块拖动）
             elif event.type == pygame.MOUSEMOTION:
+                # 标题界面按钮悬停（没有打开其他界面时）
+                if self.state == GAME_STATE_TITLE and not (self.ui_manager.settings_active or self.ui_manager.tutorial_active
+                                                           or self.ui_manager.stats_active or self.ui_manager.modal_active):
+                    self.ui_manager.update_title_hover(event.pos)
                 if self.ui_manager.settings_active:
                     # 检查是否有音量滑块正在被拖动
                     for vol_name, vol_info in self.ui_manager.volume_settings.items():
@@ -3972,11 +5799,7 @@ class Game:
                             new_value = max(0, min(100, new_value))
                             vol_info['value'] = new_value
 
-                            if vol_name == 'music' or vol_name == 'master':
-                                # 计算最终音乐音量 = 主音量 x 音乐音量
-                                master_val = self.ui_manager.volume_settings['master']['value'] / 100
-                                music_val = self.ui_manager.volume_settings['music']['value'] / 100
-                                pygame.mixer.music.set_volume(master_val * music_val)
+                            self.ui_manager.apply_volume_settings()
             
             # 鼠标释放处理
             elif event.type == pygame.MOUSEBUTTONUP:
@@ -3999,6 +5822,9 @@ class Game:
             elif event.type == pygame.WINDOWFOCUSGAINED:
                 self.has_focus = True
                 self.paused = False
+            elif event.type in (pygame.VIDEOEXPOSE, getattr(pygame, 'WINDOWEXPOSED', None)):
+                # 窗口被遮挡后重新显示，需要整屏重绘
+                self.renderer.invalidate_all()
         return running
     
     def _handle_keydown(self, event):
@@ -4009,6 +5835,11 @@ class Game:
             print("用户按下Ctrl+Q强制退出游戏")
             return False
         
+        # F3 切换性能面板
+        if event.key == pygame.K_F3:
+            self.profiler_active = not self.profiler_active
+            return True
+        
         # 退出游戏
         if event.key == pygame.K_ESCAPE:
             # 取消按键绑定
@@ -4108,9 +5939,11 @@ class Game:
                 if getattr(pygame, 'mixer', None) and getattr(pygame.mixer, 'music', None):
                     if pygame.mixer.music.get_busy():
                         pygame.mixer.music.fadeout(500)
+                        self.music_playing = False
                     else:
                         if self.music_loaded:
                             pygame.mixer.music.play(-1)
+                            self.music_playing = True
         
         # 重玩键处理（使用自定义按键绑定）
         if event.key == self.ui_manager.key_bindings['restart']['key']:
@@ -4160,7 +5993,7 @@ class Game:
                     duration=2.0,
                     rise_speed=40
                 )
-                self.floating_texts.append(ft)
+                self.add_floating_text(ft)
                 # 播放切换音效
                 Utils.play_sound(self.snd_ui_click, self)
         
@@ -4202,6 +6035,8 @@ class Game:
                     if btn_info['rect'].collidepoint(pos):
                         Utils.play_sound(self.snd_ui_click, self)
                         if btn_name == 'start':
+                            # 后台资源尚未加载完成时在此等待，游戏开始前必须就绪
+                            self.asset_loader.wait()
                             # 只有在没有过渡动画播放时才触发新动画
                             if not self.start_transition:
                                 self.start_transition = True
@@ -4269,6 +6104,7 @@ class Game:
                         value = max(0, min(100, value))
                         if self.ui_manager.active_volume:
                             self.ui_manager.volume_settings[self.ui_manager.active_volume]['value'] = value
+                            self.ui_manager.apply_volume_settings()
                     except ValueError:
                         # 输入无效，使用默认值
                         pass
@@ -4311,12 +6147,7 @@ class Game:
                 value = max(0, min(100, value))
                 if self.ui_manager.active_volume:
                     self.ui_manager.volume_settings[self.ui_manager.active_volume]['value'] = value
-            
-                    if self.ui_manager.active_volume in ['master', 'music']:
-                        # 计算最终音乐音量 = 主音量 x 音乐音量
-                        master_val = self.ui_manager.volume_settings['master']['value'] / 100
-                        music_val = self.ui_manager.volume_settings['music']['value'] / 100
-                        pygame.mixer.music.set_volume(master_val * music_val)
+                    self.ui_manager.apply_volume_settings()
             except ValueError:
                 # 输入无效，使用默认值
                 pass
@@ -4335,31 +6166,19 @@ class Game:
                 if self.ui_manager.active_volume:
                     self.ui_manager.volume_settings[self.ui_manager.active_volume]['value'] = 0
                     
-                    # 如果是主音量或音乐音量，立即更新音乐播放音量
-                    if self.ui_manager.active_volume in ['master', 'music']:
-                        # 计算最终音乐音量 = 主音量 x 音乐音量
-                        master_val = self.ui_manager.volume_settings['master']['value'] / 100
-                        music_val = self.ui_manager.volume_settings['music']['value'] / 100
-                        pygame.mixer.music.set_volume(master_val * music_val)
+                    # 立即更新音乐和音效音量
+                    self.ui_manager.apply_volume_settings()
                 self.ui_manager.number_input_active = False
             else:
                 # 删除最后一个字符
                 self.ui_manager.input_value = self.ui_manager.input_value[:-1]
-                # 实时更新音乐音量（如果是音量设置）
-                if self.ui_manager.active_volume in ['master', 'music'] and self.ui_manager.input_value:
+                # 实时更新音量（如果是音量设置）
+                if self.ui_manager.active_volume and self.ui_manager.input_value:
                     try:
                         temp_value = int(self.ui_manager.input_value)
                         temp_value = max(0, min(100, temp_value))
-                        # 计算最终音乐音量 = 主音量 x 音乐音量
-                        master_val = self.ui_manager.volume_settings['master']['value'] / 100
-                        music_val = self.ui_manager.volume_settings['music']['value'] / 100
-                        # 如果正在编辑的是主音量，使用临时值
-                        if self.ui_manager.active_volume == 'master':
-                            master_val = temp_value / 100
-                        # 如果正在编辑的是音乐音量，使用临时值
-                        elif self.ui_manager.active_volume == 'music':
-                            music_val = temp_value / 100
-                        pygame.mixer.music.set_volume(master_val * music_val)
+                        # 使用临时值实时预览音量
+                        self.ui_manager.apply_volume_settings((self.ui_manager.active_volume, temp_value))
                     except ValueError:
                         pass
         
@@ -4377,135 +6196,282 @@ class Game:
                     if int(self.ui_manager.input_value) > 100:
                         self.ui_manager.input_value = "100"
                     
-                    # 实时更新音乐音量（如果是音量设置）
-                    if self.ui_manager.active_volume in ['master', 'music']:
+                    # 实时更新音量（如果是音量设置）
+                    if self.ui_manager.active_volume:
                         # 临时更新音量设置以计算实时值
                         temp_value = int(self.ui_manager.input_value)
                         temp_value = max(0, min(100, temp_value))
-                        # 计算最终音乐音量 = 主音量 x 音乐音量
-                        master_val = self.ui_manager.volume_settings['master']['value'] / 100
-                        music_val = self.ui_manager.volume_settings['music']['value'] / 100
-                        # 如果正在编辑的是主音量，使用临时值
-                        if self.ui_manager.active_volume == 'master':
-                            master_val = temp_value / 100
-                        # 如果正在编辑的是音乐音量，使用临时值
-                        elif self.ui_manager.active_volume == 'music':
-                            music_val = temp_value / 100
-                        pygame.mixer.music.set_volume(master_val * music_val)
+                        # 使用临时值实时预览音量
+                        self.ui_manager.apply_volume_settings((self.ui_manager.active_volume, temp_value))
                 except ValueError:
                     pass
 
     def notice(self, within_seconds: float, *strings):
-        """在右上角HUD中逐个字符显示通知信息，并在指定时间后逐个字符清除
+        """在右上角HUD中逐个字符显示通知信息，完整显示5秒后逐个字符清除
         
         Args:
             within_seconds: 字符全部显示所需的总时间（秒）
             *strings: 要显示的字符串内容，多个参数将被合并显示
         """
         
-        # 合并所有字符串
+        # 合并所有字符串，交给通知层按时间逐字显示和清除
         full_text = ' '.join(strings)
-        total_chars = len(full_text)
-        
-        # 为每条通知生成唯一标识
-        notice_id = str(uuid4())[:8]  # 使用短uuid作为唯一标识
-        
-        # 计算每个字符的显示间隔（毫秒）
-        char_interval_ms = (within_seconds * 1000) / total_chars if total_chars > 0 else 100
-        
-        # 当前显示的字符数
-        current_chars = [0]
-        
-        # 显示阶段标识
-        is_showing = [True]
-        
-        # 清除阶段标识
-        is_clearing = [False]
-        
-        # 用于存储任务对象的列表
-        tasks = []
-        
-        def update_notice():
-            """更新通知文本显示状态"""
-            if is_showing[0]:
-                # 显示阶段
-                if current_chars[0] < total_chars:
-                    current_chars[0] += 1
-                    display_text = full_text[:current_chars[0]]
-                    self.ui_manager.add_top_right_text(display_text, COLOR_LIGHT_YELLOW, key=f'notice_{notice_id}')
-                else:
-                    # 显示完成，停止显示任务，5秒后开始清除
-                    is_showing[0] = False
-                    
-                    def start_clearing():
-                        """开始清除过程"""
-                        is_clearing[0] = True
-                        # 创建清除任务
-                        clear_task = runTaskTimer(clear_notice, 0, char_interval_ms)
-                        tasks.append(clear_task)
-                    
-                    # 5秒后开始清除
-                    delay_task = runTaskLater(start_clearing, 5000)
-                    tasks.append(delay_task)
-            elif is_clearing[0]:
-                # 清除阶段
-                if current_chars[0] > 0:
-                    current_chars[0] -= 1
-                    display_text = full_text[:current_chars[0]]
-                    self.ui_manager.add_top_right_text(display_text, COLOR_LIGHT_YELLOW, key=f'notice_{notice_id}')
-                else:
-                    # 清除完成，移除文本并取消任务
-                    self.ui_manager.remove_top_right_text(f'notice_{notice_id}')
-                    is_clearing[0] = False
-                    # 取消所有相关任务
-                    for task in tasks:
-                        task.cancel()
-        
-        def clear_notice():
-            """清除通知文本"""
-            if is_clearing[0]:
-                if current_chars[0] > 0:
-                    current_chars[0] -= 1
-                    display_text = full_text[:current_chars[0]]
-                    self.ui_manager.add_top_right_text(display_text, COLOR_LIGHT_YELLOW, key=f'notice_{notice_id}')
-                else:
-                    # 清除完成，移除文本并取消任务
-                    self.ui_manager.remove_top_right_text(f'notice_{notice_id}')
-                    is_clearing[0] = False
-                    # 取消所有相关任务
-                    for task in tasks:
-                        task.cancel()
-        
-        # 如果有文本需要显示
-        if total_chars > 0:
-            # 创建显示任务
-            show_task = runTaskTimer(update_notice, 0, char_interval_ms)
-            tasks.append(show_task)
-            
-            # 初始化显示第一个字符
-            self.ui_manager.add_top_right_text(full_text[0], COLOR_LIGHT_YELLOW, key=f'notice_{notice_id}')
-            current_chars[0] = 1
-        
-        # 返回一个对象，允许手动取消通知
-        class NoticeHandle:
-            def cancel(self):
-                # 取消所有任务并立即清除通知
-                for task in tasks:
-                    task.cancel()
-                self.ui_manager.remove_top_right_text(f'notice_{notice_id}')
-        
-        return NoticeHandle()
+        return self.ui_manager.notice_layer.add(full_text, within_seconds * 1000)
+
+class Benchmarks:
+    """性能基准测试集合，通过命令行 `python main.py --bench <名称>` 运行"""
+
+    @staticmethod
+    def _measure(func, frames):
+        """执行 func frames 次，返回平均每次耗时（毫秒）"""
+        func()  # 预热，填充各类缓存
+        start = perf_counter()
+        for _ in range(frames):
+            func()
+        return (perf_counter() - start) * 1000 / frames
+
+    @staticmethod
+    def _game():
+        """创建游戏实例并等待后台资源加载完成"""
+        game = Game(debug=global_debug)
+        game.asset_loader.wait()
+        return game
+
+    @staticmethod
+    def render(sprite_count=1000, frames=200):
+        """对比逐个 draw 与按图层 Surface.blits 批量提交的绘制耗时"""
+        game = Benchmarks._game()
+        game.state = GAME_STATE_PLAYING
+        enemy_images = [game.enemy_img1, game.enemy_img2, game.enemy_img3, game.enemy_img4]
+        angles = [0, 0, -15, 15, -7.5, 7.5]
+        for i in range(sprite_count):
+            x = random.randint(0, SCREEN_W - 48)
+            y = random.randint(0, SCREEN_H - 48)
+            if i % 2 == 0:
+                game.enemies.append(Enemy(x, y, game, image=enemy_images[i % 4]))
+            else:
+                b = game.create_bullet(BULLET_OWNER_PLAYER, x, y, -600)
+                b.angle = angles[i % len(angles)]
+                game.bullets.append(b)
+        screen = game.screen
+
+        def draw_each():
+            for e in game.enemies:
+                e.draw(screen)
+            for b in game.bullets:
+                b.draw(screen)
+
+        def draw_batched():
+            screen.blits([e.blit_item() for e in game.enemies], doreturn=False)
+            screen.blits([b.blit_item() for b in game.bullets], doreturn=False)
+
+        each_ms = Benchmarks._measure(draw_each, frames)
+        batched_ms = Benchmarks._measure(draw_batched, frames)
+        print(f"render: {sprite_count} sprites, {frames} frames")
+        print(f"  per-entity draw : {each_ms:.3f} ms/frame")
+        print(f"  layered blits   : {batched_ms:.3f} ms/frame ({each_ms / batched_ms:.2f}x)")
+
+    @staticmethod
+    def atlas(sprite_count=1000, frames=200):
+        """对比独立表面、图集子表面、图集区域三种方式批量绘制精灵的耗时"""
+        game = Benchmarks._game()
+        screen = game.screen
+        # 只比较实际打包进图集的精灵（不透明和 RLE 的图片不进图集）
+        keys = list(global_asset_cache.atlas.regions)
+        separate = {key: Utils.load_image(*key) for key in keys}
+        positions = [(random.randint(0, SCREEN_W - 64), random.randint(0, SCREEN_H - 64)) for _ in range(sprite_count)]
+        picks = [keys[i % len(keys)] for i in range(sprite_count)]
+
+        separate_items = [(separate[key], pos) for key, pos in zip(picks, positions)]
+        sub_items = [(global_asset_cache.get_image(*key), pos) for key, pos in zip(picks, positions)]
+        area_items = []
+        for key, pos in zip(picks, positions):
+            atlas_surf, area = global_asset_cache.get_region(*key)
+            area_items.append((atlas_surf, pos, area))
+
+        separate_ms = Benchmarks._measure(lambda: screen.blits(separate_items, doreturn=False), frames)
+        sub_ms = Benchmarks._measure(lambda: screen.blits(sub_items, doreturn=False), frames)
+        area_ms = Benchmarks._measure(lambda: screen.blits(area_items, doreturn=False), frames)
+        atlas_surf = global_asset_cache.atlas.surface
+        print(f"atlas: {sprite_count} sprites, {frames} frames, atlas {atlas_surf.get_width()}x{atlas_surf.get_height()}"
+              f" ({global_asset_cache.atlas.usage() * 100:.0f}% used)")
+        print(f"  separate surfaces : {separate_ms:.3f} ms/frame")
+        print(f"  atlas subsurfaces : {sub_ms:.3f} ms/frame")
+        print(f"  atlas area blits  : {area_ms:.3f} ms/frame")
+
+    @staticmethod
+    def audio(plays=2000):
+        """模拟密集射击时的音效播放：对比每次播放都设置音量的旧做法与 AudioManager"""
+        game = Benchmarks._game()
+        sounds = [game.snd_player_shoot, game.snd_enemy_shoot, game.snd_explode]
+        if not all(sounds) or not global_audio_manager.channels:
+            print("audio: 音频不可用，跳过")
+            return
+        volume_settings = game.ui_manager.volume_settings
+
+        def play_legacy():
+            for i in range(plays):
+                sound = sounds[i % len(sounds)]
+                sound.set_volume(volume_settings['sound']['value'] / 100 * volume_settings['master']['value'] / 100)
+                sound.play()
+
+        def play_managed():
+            for i in range(plays):
+                Utils.play_sound(sounds[i % len(sounds)], game)
+
+        legacy_ms = Benchmarks._measure(play_legacy, 5)
+        pygame.mixer.stop()
+        global_audio_manager.played = global_audio_manager.stolen = global_audio_manager.dropped = 0
+        managed_ms = Benchmarks._measure(play_managed, 5)
+        pygame.mixer.stop()
+        print(f"audio: {plays} plays per burst")
+        print(f"  set_volume + Sound.play : {legacy_ms / plays * 1000:.2f} us/play")
+        print(f"  AudioManager.play       : {managed_ms / plays * 1000:.2f} us/play")
+        for line in global_audio_manager.profile_lines():
+            print(f"  {line}")
+
+    @staticmethod
+    def formats(blits=500):
+        """列出每张图片最终使用的表面格式，并与逐像素 alpha 格式比较绘制耗时"""
+        game = Benchmarks._game()
+        screen = game.screen
+
+        def blit_us(surf):
+            w, h = surf.get_size()
+            positions = [(i * 37 % max(1, SCREEN_W - w), i * 53 % max(1, SCREEN_H - h)) for i in range(blits)]
+            items = [(surf, pos) for pos in positions]
+            return Benchmarks._measure(lambda: screen.blits(items, doreturn=False), 5) * 1000 / blits
+
+        print(f"formats: {blits} blits per asset")
+        print(f"  {'asset':<22}{'size':>10}  {'format':<16}{'final us':>10}{'alpha us':>10}")
+        for (name, size), kind in sorted(global_asset_cache.formats.items()):
+            surf = global_asset_cache.get_image(name, size)
+            alpha_surf = surf.convert_alpha()
+            final = blit_us(surf)
+            baseline = blit_us(alpha_surf)
+            size_text = f"{surf.get_width()}x{surf.get_height()}"
+            print(f"  {name:<22}{size_text:>10}  {kind:<16}{final:>10.2f}{baseline:>10.2f}")
+
+    @staticmethod
+    def spawn(count=2000):
+        """测量道具与随机事件的生成耗时，并输出资源缓存命中情况"""
+        Benchmarks._game()  # 初始化显示模式与资源
+        powerup_classes = [SpeedPowerUp, ShieldPowerUp, HealPowerUp, SuperRapidShootPowerUp, SuperScatterShootPowerUp]
+        global_asset_cache.hits = global_asset_cache.misses = 0
+
+        def spawn_all():
+            for i in range(count):
+                powerup_classes[i % len(powerup_classes)](0, 0)
+                RandomEvent(0, 0)
+
+        start = perf_counter()
+        spawn_all()
+        elapsed_ms = (perf_counter() - start) * 1000
+        print(f"spawn: {count} powerups + {count} random events")
+        print(f"  total    : {elapsed_ms:.2f} ms ({elapsed_ms * 1000 / (count * 2):.2f} us/entity)")
+        print(f"  {global_asset_cache.report()}")
+
+    @staticmethod
+    def timers(count=10000, frames=1000):
+        """在大量未到期定时器下测量每帧调度开销：对比逐个检查全部任务的线性扫描与最小堆"""
+        scheduler = TaskScheduler()
+        for i in range(count):
+            scheduler.add_task(Task(lambda: None, 60000 + i))
+        for _ in range(10):
+            scheduler.add_task(Task(lambda: None, 0))  # 每帧到期的任务
+        tasks = scheduler.tasks
+
+        def scan():
+            # 重构前的做法：每帧检查每个任务并重建活跃列表
+            active = []
+            for task in tasks:
+                if task.should_run():
+                    task.run()
+                if not task.is_cancelled:
+                    active.append(task)
+
+        scan_ms = Benchmarks._measure(scan, frames)
+        heap_ms = Benchmarks._measure(scheduler.update, frames)
+
+        start = perf_counter()
+        handles = [scheduler.add_task(Task(lambda: None, 30000)) for _ in range(count)]
+        add_us = (perf_counter() - start) * 1e6 / count
+        start = perf_counter()
+        for handle in handles:
+            handle.cancel()
+        scheduler.update()
+        cancel_us = (perf_counter() - start) * 1e6 / count
+        print(f"timers: {count} pending + 10 due every frame, {frames} frames")
+        print(f"  linear scan : {scan_ms * 1000:.2f} us/frame")
+        print(f"  min-heap    : {heap_ms * 1000:.2f} us/frame ({scan_ms / heap_ms:.0f}x)")
+        print(f"  add {add_us:.2f} us/task, cancel {cancel_us:.2f} us/task, heap {len(scheduler.heap)} entries")
+
+    @staticmethod
+    def timer_soak(minutes=30, timers=50):
+        """长时间运行带延迟的周期定时器，输出调度耗时和堆大小的变化（正确性由 tests/test_scheduler.py 检查）"""
+        clock = SimulationClock()
+        scheduler = TaskScheduler(clock)
+        calls = [0]
+
+        def tick():
+            calls[0] += 1
+
+        handles = [runTaskTimer(tick, 500 + i * 10, 1000, scheduler=scheduler) for i in range(timers)]
+        counts = []
+        start = perf_counter()
+        for frame in range(minutes * 60 * FPS):
+            clock.advance(1000 / FPS)
+            scheduler.update()
+            if frame % (60 * FPS) == 0:
+                counts.append(len(scheduler.heap))
+        elapsed = perf_counter() - start
+        print(f"timer-soak: {timers} delayed periodic timers, {minutes} simulated minutes ({elapsed:.2f} s)")
+        print(f"  heap size per minute: min {min(counts)}, max {max(counts)}, calls {calls[0]}")
+
+        for handle in handles:
+            handle.cancel()
+        calls[0] = 0
+        for _ in range(10 * FPS):
+            clock.advance(1000 / FPS)
+            scheduler.update()
+        print(f"  after cancel: {len(scheduler)} live tasks, {calls[0]} calls")
+
+    @staticmethod
+    def run(names):
+        """运行指定名称的基准测试"""
+        benchmarks = {
+            'render': Benchmarks.render,
+            'atlas': Benchmarks.atlas,
+            'audio': Benchmarks.audio,
+            'formats': Benchmarks.formats,
+            'spawn': Benchmarks.spawn,
+            'timers': Benchmarks.timers,
+            'timer-soak': Benchmarks.timer_soak,
+        }
+        for name in names or list(benchmarks):
+            if name not in benchmarks:
+                Utils.error(f"未知的基准测试: {name}，可选: {', '.join(benchmarks)}")
+                continue
+            benchmarks[name]()
 
 def main():
+    global_startup_profiler.mark('模块导入')
+    global global_debug
+    global_debug = '--debug' in sys.argv
     Utils.debug("开始游戏启动...")
     Utils.debug("初始化PyGame...")
-    pygame.init()
+    # 混音器参数需在 pygame.init() 之前设置，pygame.init() 会按此配置初始化混音器
+    global_audio_manager.configure(buffer=Utils.cli_int('--audio-buffer', AUDIO_BUFFER),
+                                   channel_count=Utils.cli_int('--audio-channels', AUDIO_CHANNELS))
+    with global_startup_profiler.section('pygame.init'):
+        pygame.init()
     Utils.debug("PyGame核心模块初始化完成")
     pygame.display.init()
     Utils.debug("显示模块初始化完成")
     pygame.font.init()
     Utils.debug("字体模块初始化完成")
-    pygame.mixer.init()
+    with global_startup_profiler.section('mixer.init'):
+        global_audio_manager.init()
     Utils.debug("音频模块初始化完成")
     
     pygame.key.set_repeat(1000, 200)
@@ -4515,8 +6481,28 @@ def main():
     except Exception:
         pass
     
-    game = Game()
-    game.run()
+    if '--bake-assets' in sys.argv:
+        AssetPack.bake()
+        pygame.quit()
+        return
+
+    if '--bench' in sys.argv:
+        # --bench 之后直到下一个选项为止的参数是基准测试名称
+        names = []
+        for arg in sys.argv[sys.argv.index('--bench') + 1:]:
+            if arg.startswith('--'):
+                break
+            names.append(arg)
+        Benchmarks.run(names)
+        pygame.quit()
+        return
+
+    game = Game(dirty_rects='--dirty-rects' in sys.argv, debug=global_debug)
+    if '--asyncio' in sys.argv:
+        import asyncio  # 仅异步模式需要，延迟导入以缩短启动时间
+        asyncio.run(game.run_async())
+    else:
+        game.run()
 
 if __name__ == '__main__':
     try:
@@ -4524,5 +6510,6 @@ if __name__ == '__main__':
     except Exception as e:
         Utils.error(f"游戏运行出错: {e}")
         Utils.error("错误详情:")
+        from traceback import print_exc  # 仅出错时需要，延迟导入
         print_exc()
         input("按Enter键退出...")
@@ -0,0 +1,113 @@
+import os
+import sys
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import main  # noqa: E402
+
+FRAME_MS = 1000 / main.FPS
+
+
+def run_frames(clock, scheduler, frames):
+    for _ in range(frames):
+        clock.advance(FRAME_MS)
+        scheduler.update()
+
+
+def make_scheduler():
+    clock = main.SimulationClock()
+    return clock, main.TaskScheduler(clock)
+
+
+def test_delayed_timer_task_count_stays_flat():
+    clock, scheduler = make_scheduler()
+    calls = [0]
+
+    def tick():
+        calls[0] += 1
+
+    for i in range(50):
+        main.runTaskTimer(tick, 500 + i * 10, 1000, scheduler=scheduler)
+
+    counts = []
+    for _ in range(10):
+        run_frames(clock, scheduler, 60 * main.FPS)
+        counts.append(len(scheduler.heap))
+
+    assert counts == [50] * 10
+    assert len(scheduler) == 50
+    # 每个定时器在 600 秒内最多执行 600 次（按帧对齐会略少），没有因重复创建而成倍增加
+    assert 50 * 580 <= calls[0] <= 50 * 600
+
+
+def test_delayed_timer_first_run_and_period():
+    clock, scheduler = make_scheduler()
+    runs = []
+    main.runTaskTimer(lambda: runs.append(clock.now()), 500, 1000, scheduler=scheduler)
+
+    clock.advance(1499)
+    scheduler.update()
+    assert runs == []
+    clock.advance(1)
+    scheduler.update()
+    assert runs == [1500]
+    clock.advance(1000)
+    scheduler.update()
+    assert runs == [1500, 2500]
+
+
+def test_cancel_stops_delayed_timer_in_both_phases():
+    clock, scheduler = make_scheduler()
+    calls = [0]
+
+    def tick():
+        calls[0] += 1
+
+    waiting = main.runTaskTimer(tick, 5000, 100, scheduler=scheduler)
+    running = main.runTaskTimer(tick, 100, 100, scheduler=scheduler)
+    waiting.cancel()
+    run_frames(clock, scheduler, main.FPS)
+    assert calls[0] > 0
+
+    running.cancel()
+    calls[0] = 0
+    run_frames(clock, scheduler, 10 * main.FPS)
+    assert calls[0] == 0
+    assert len(scheduler) == 0
+    assert scheduler.heap == []
+
+
+def test_run_task_later_fires_once():
+    clock, scheduler = make_scheduler()
+    calls = [0]
+
+    def fire():
+        calls[0] += 1
+
+    main.runTaskLater(fire, 10, scheduler=scheduler)
+    run_frames(clock, scheduler, 10)
+    assert calls[0] == 1
+    assert len(scheduler) == 0
+
+
+def make_game():
+    import pygame
+    pygame.init()
+    game = main.Game()
+    game.asset_loader.wait()
+    return game
+
+
+def test_restart_after_shoot_powerup_restores_flags(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    game = make_game()
+    for powerup_class in (main.SuperRapidShootPowerUp, main.SuperScatterShootPowerUp):
+        powerup_class(0, 0).use(game.player, game)
+        assert not game.allow_switch_shoot_type
+        game.reset()
+        main.global_sim_clock.advance(20000)
+        main.global_task_scheduler.update()
+        assert game.allow_switch_shoot_type
+        assert not game.bullets_piercing